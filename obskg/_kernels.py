@@ -0,0 +1,55 @@
+"""
+Optional compiled kernels.
+
+When `numba` is installed, the functions here are JIT-compiled to native
+code; otherwise `best_above` is ``None`` and callers fall back to NumPy.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # pragma: no cover
+    njit = None  # type: ignore
+
+
+best_above = None
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True, parallel=True)
+    def _best_above(matrix, q, threshold, blocks):
+        n, d = matrix.shape
+        block_score = np.full(blocks, -np.inf, dtype=np.float32)
+        block_index = np.full(blocks, -1, dtype=np.int64)
+        for b in prange(blocks):
+            lo = b * n // blocks
+            hi = (b + 1) * n // blocks
+            for i in range(lo, hi):
+                s = np.float32(0.0)
+                for j in range(d):
+                    s += matrix[i, j] * q[j]
+                if s >= threshold and s > block_score[b]:
+                    block_score[b] = s
+                    block_index[b] = i
+        best_i = -1
+        best_s = -np.inf
+        for b in range(blocks):
+            if block_index[b] >= 0 and block_score[b] > best_s:
+                best_s = block_score[b]
+                best_i = block_index[b]
+        return best_i, best_s
+
+    def best_above(matrix, q, threshold):  # type: ignore[no-redef]
+        """Return ``(index, score)`` of the row of ``matrix`` with the highest
+        dot product with ``q`` that is at least ``threshold``, or ``(-1, -inf)``.
+
+        Dot products, threshold test and argmax are fused into one pass over
+        the matrix, so no temporary similarity vector is allocated.  Rows are
+        split into one contiguous block per thread and the per-block winners
+        are reduced at the end.
+        """
+        blocks = min(get_num_threads(), max(matrix.shape[0], 1))
+        return _best_above(matrix, q, threshold, blocks)
@@ -12,8 +12,11 @@ cache lookups in a RAG pipeline.
 
 Two caches are provided:
 
-* `EmbeddingCache` – maps text hashes to vector embeddings.  Uses SHA256 to
-  derive keys and stores vectors as BLOBs via Python’s `pickle` module.
+* `EmbeddingCache` – maps text hashes to vector embeddings.  Uses BLAKE3
+  (when the optional ``blake3`` package is installed) or SHA256 to derive
+  keys, recording the choice in the database so every process sharing it
+  keeps using the same one, and stores vectors as raw contiguous ``float32`` (or, optionally,
+  ``float16``) BLOBs.
 * `ResponseCache` – maps a prompt string (or another fingerprint) to a
   generated response.  Stores responses as plain text.
 
@@ -23,97 +26,381 @@ These caches support an optional time‑to‑live (TTL) value to expire entries.
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
-import pickle
+import queue
 import sqlite3
+import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Sequence, Tuple
+from typing import Iterator, Optional, Sequence, Tuple
 
 import numpy as np
 
+try:
+    import faiss
+except ImportError:  # pragma: no cover
+    faiss = None  # type: ignore
 
-def _hash_text(text: str) -> str:
-    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # pragma: no cover
+    _blake3 = None  # type: ignore
+
+
+# Digest used for keys of new cache tables
+DEFAULT_HASH_ALGORITHM = "blake3" if _blake3 is not None else "sha256"
+
+
+def hash_text(text: str, algorithm: Optional[str] = None) -> str:
+    """Return the hex digest of ``text`` used as a cache key.
+
+    ``algorithm`` is ``"blake3"`` or ``"sha256"`` and defaults to
+    ``DEFAULT_HASH_ALGORITHM`` (BLAKE3 if installed, else SHA-256).
+    """
+    algorithm = algorithm or DEFAULT_HASH_ALGORITHM
+    if algorithm == "blake3":
+        if _blake3 is None:
+            raise ImportError("blake3 package is required for keys hashed with BLAKE3")
+        return _blake3(text.encode("utf-8")).hexdigest()
+    if algorithm == "sha256":
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    raise ValueError(f"Unsupported hash algorithm {algorithm!r}")
+
+
+def _key_algorithm(conn: sqlite3.Connection, table: str) -> str:
+    """Return the digest that keys ``table``, recording it for new tables.
+
+    Keys of a shared database only match if every process hashes them the
+    same way, whether or not it has ``blake3`` installed.  Tables written
+    before the choice was recorded use SHA-256.
+    """
+    conn.execute("CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value TEXT)")
+    name = f"{table}.hash_algorithm"
+    row = conn.execute("SELECT value FROM cache_meta WHERE name=?", (name,)).fetchone()
+    if row:
+        algorithm = row[0]
+    else:
+        populated = conn.execute(f"SELECT 1 FROM {table} LIMIT 1").fetchone() is not None
+        algorithm = "sha256" if populated else DEFAULT_HASH_ALGORITHM
+        conn.execute("INSERT INTO cache_meta (name, value) VALUES (?, ?)", (name, algorithm))
+        conn.commit()
+    hash_text("", algorithm)  # Fail now if the recorded digest is unavailable
+    return algorithm
+
+
+# Storage precisions supported by ``EmbeddingCache``
+VECTOR_DTYPES = {"float32": np.float32, "float16": np.float16}
+
+
+def _encode_vector(vector: Sequence[float], dtype: str = "float32") -> bytes:
+    """Serialize a vector as raw contiguous ``float32`` (or ``dtype``) bytes."""
+    return np.ascontiguousarray(vector, dtype=VECTOR_DTYPES[dtype]).tobytes()
+
+
+def _decode_vector(blob: bytes, dtype: str = "float32") -> np.ndarray:
+    """Inverse of :func:`_encode_vector`, always returning ``float32``.
+
+    ``float32`` blobs are returned as a read-only zero-copy view; ``float16``
+    blobs are widened into a new array.
+    """
+    vec = np.frombuffer(blob, dtype=VECTOR_DTYPES[dtype])
+    return vec if vec.dtype == np.float32 else vec.astype(np.float32)
+# Applied to every cache and metadata connection: WAL lets readers proceed while a write
+
+# Applied to every cache connection: WAL lets readers proceed while a write
+# commits, and synchronous=NORMAL avoids an fsync per ``set`` call.
+SQLITE_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA mmap_size=268435456;
+PRAGMA cache_size=-65536;
+"""
+
+
+def connect(path: Path) -> sqlite3.Connection:
+    """Open a cache database that can be shared between threads.
+
+    Callers must serialize access to the returned connection themselves
+    (each cache holds a lock for this purpose).
+    """
+    conn = sqlite3.connect(str(path), check_same_thread=False)
+    conn.executescript(SQLITE_PRAGMAS)
+    return conn
+
+
+# Rows inserted per transaction by ``SemanticResponseCache.warm_up``
+_WARM_UP_BATCH = 10_000
+
+
+# Version 0 databases stored vectors as pickled Python lists; version 1 uses
+# raw float32 BLOBs; version 2 stores semantic cache vectors at unit length.
+# Tracked via ``PRAGMA user_version``.
+_SCHEMA_VERSION = 2
+
+
+def _migrate_vectors(
+    conn: sqlite3.Connection, table: str, key_column: str, value_column: str, normalize: bool = False
+) -> None:
+    """Bring vectors written by older releases up to the current encoding.
+
+    Float32 vectors are scaled to unit length when ``normalize`` is set.
+    Pickled (version 0) entries are discarded rather than unpickled: cache
+    files may be shared through a synced vault, and unpickling untrusted
+    data can execute arbitrary code.
+    """
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    if version >= _SCHEMA_VERSION:
+        return
+    if version < 1:
+        conn.execute(f"DELETE FROM {table}")
+        rows = []
+    elif normalize:
+        rows = conn.execute(f"SELECT {key_column}, {value_column} FROM {table}").fetchall()
+    else:
+        rows = []
+    for key, blob in rows:
+        vec = _decode_vector(blob)
+        if normalize:
+            vec = _normalize_rows(vec.reshape(1, -1))[0]
+        conn.execute(f"UPDATE {table} SET {value_column}=? WHERE {key_column}=?", (_encode_vector(vec), key))
+    conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+    conn.commit()
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """Scale each row of ``matrix`` to unit L2 norm (zero rows are left as is).
+
+    The result is always a C-contiguous ``float32`` array so that similarity
+    products dispatch to single-precision BLAS kernels.
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.ascontiguousarray(matrix / norms)
+
+
+class _NumpyFlatIP:
+    """Exact inner-product index mirroring the subset of ``faiss.IndexFlatIP``
+    used by :class:`SemanticResponseCache`.  Used when FAISS is not installed."""
+
+    def __init__(self, d: int) -> None:
+        self.d = d
+        # Preallocated (capacity, d) buffer; rows [0, ntotal) are in use
+        self._buf = np.empty((16, d), dtype=np.float32)
+        self.ntotal = 0
+
+    @property
+    def _xb(self) -> np.ndarray:
+        return self._buf[: self.ntotal]
+
+    def add(self, x: np.ndarray) -> None:
+        x = np.asarray(x, dtype=np.float32).reshape(-1, self.d)
+        needed = self.ntotal + x.shape[0]
+        if needed > self._buf.shape[0]:
+            # Geometric growth keeps appends amortized O(1) per row
+            capacity = max(needed, 2 * self._buf.shape[0])
+            grown = np.empty((capacity, self.d), dtype=np.float32)
+            grown[: self.ntotal] = self._xb
+            self._buf = grown
+        self._buf[self.ntotal : needed] = x
+        self.ntotal = needed
+
+    def search(self, x: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        x = np.asarray(x, dtype=np.float32)
+        # (n, d) @ (d, nq): a single SGEMV call for the usual one-query case
+        sims = (self._xb @ x.T).T
+        k_eff = min(k, self.ntotal)
+        if k_eff < self.ntotal:
+            # Partial selection of the top k, then sort only those k
+            top = np.argpartition(-sims, k_eff - 1, axis=1)[:, :k_eff]
+        else:
+            top = np.broadcast_to(np.arange(self.ntotal), sims.shape)
+        order = np.take_along_axis(top, np.argsort(-np.take_along_axis(sims, top, axis=1), axis=1), axis=1)
+        scores = np.full((x.shape[0], k), -np.inf, dtype=np.float32)
+        indices = np.full((x.shape[0], k), -1, dtype=np.int64)
+        scores[:, :k_eff] = np.take_along_axis(sims, order, axis=1)
+        indices[:, :k_eff] = order
+        return scores, indices
+
+    def best_above(self, q: np.ndarray, threshold: float) -> Tuple[int, float]:
+        """Return ``(index, score)`` of the best match scoring at least
+        ``threshold``, or ``(-1, -inf)`` when nothing qualifies."""
+        q = np.ascontiguousarray(q, dtype=np.float32)
+        # Imported lazily so that numba is only loaded once a lookup needs it
+        from . import _kernels
+
+        if _kernels.best_above is not None:
+            idx, score = _kernels.best_above(self._xb, q, np.float32(threshold))
+            return int(idx), float(score)
+        sims = self._xb @ q
+        candidates = np.flatnonzero(sims >= threshold)
+        if candidates.size == 0:
+            return -1, float("-inf")
+        best = int(candidates[np.argmax(sims[candidates])])
+        return best, float(sims[best])
+
+
+def _best_above(index, query: np.ndarray, threshold: float) -> Tuple[int, float]:
+    """Nearest neighbour of a single normalized ``query`` if it meets ``threshold``."""
+    if isinstance(index, _NumpyFlatIP):
+        # Cache misses (no candidate above threshold) skip the argmax entirely
+        return index.best_above(query[0], threshold)
+    scores, indices = index.search(query, 1)
+    idx, score = int(indices[0, 0]), float(scores[0, 0])
+    if idx < 0 or score < threshold:
+        return -1, float("-inf")
+    return idx, score
+
+
+def _new_flat_index(d: int):
+    """Return a flat inner-product index, preferring FAISS when available."""
+    if faiss is not None:
+        return faiss.IndexFlatIP(d)
+    return _NumpyFlatIP(d)
+
+
+class _ConnPool:
+    """One writer connection plus a pool of read-only connections.
+
+    Under WAL, readers neither block each other nor the writer, so
+    concurrent ``get`` calls from worker threads run in parallel while
+    writes are serialized through a single connection.  In-memory
+    databases cannot be shared between connections, so for ``:memory:``
+    all access goes through the writer.
+    """
+
+    def __init__(self, path: Path, readers: int = 4) -> None:
+        self.writer = connect(path)
+        self._write_lock = threading.RLock()
+        self._readers: Optional["queue.Queue[sqlite3.Connection]"] = None
+        if str(path) != ":memory:" and readers > 0:
+            self._readers = queue.Queue()
+            for _ in range(readers):
+                conn = connect(path)
+                conn.execute("PRAGMA query_only=1")
+                self._readers.put(conn)
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        with self._write_lock:
+            yield self.writer
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        if self._readers is None:
+            with self.write() as conn:
+                yield conn
+            return
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
 
 
 @dataclass
 class EmbeddingCache:
     path: Path
     ttl: Optional[int] = None  # Time to live in seconds
+    readers: int = 4  # Read-only connections available to concurrent lookups
+    # Precision of newly written vectors ("float32" or "float16"); lookups
+    # always return float32 whatever precision an entry was stored with
+    dtype: str = "float32"
 
     def __post_init__(self) -> None:
-        self.conn = sqlite3.connect(str(self.path))
-        cur = self.conn.cursor()
-        cur.execute(
-            "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, value BLOB, timestamp REAL)"
-        )
-        self.conn.commit()
-
-    def get(self, text: str) -> Optional[Sequence[float]]:
-        key = _hash_text(text)
-        cur = self.conn.cursor()
-        cur.execute("SELECT value, timestamp FROM embeddings WHERE key=?", (key,))
-        row = cur.fetchone()
+        if self.dtype not in VECTOR_DTYPES:
+            raise ValueError(f"Unsupported dtype {self.dtype!r}; expected one of {sorted(VECTOR_DTYPES)}")
+        self._pool = _ConnPool(self.path, self.readers)
+        with self._pool.write() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key TEXT PRIMARY KEY, value BLOB, timestamp REAL, dtype TEXT NOT NULL DEFAULT 'float32')"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(embeddings)")}
+            if "dtype" not in columns:
+                conn.execute("ALTER TABLE embeddings ADD COLUMN dtype TEXT NOT NULL DEFAULT 'float32'")
+            conn.commit()
+            _migrate_vectors(conn, "embeddings", "key", "value")
+            self.hash_algorithm = _key_algorithm(conn, "embeddings")
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        key = hash_text(text, self.hash_algorithm)
+        with self._pool.read() as conn:
+            row = conn.execute("SELECT value, timestamp, dtype FROM embeddings WHERE key=?", (key,)).fetchone()
         if not row:
             return None
-        value_blob, ts = row
+        value_blob, ts, dtype = row
         if self.ttl is not None and (time.time() - ts) > self.ttl:
             # expired
-            cur.execute("DELETE FROM embeddings WHERE key=?", (key,))
-            self.conn.commit()
-            return None
-        try:
-            return pickle.loads(value_blob)
-        except Exception:
+            with self._pool.write() as conn:
+                conn.execute("DELETE FROM embeddings WHERE key=?", (key,))
+                conn.commit()
             return None
+        return _decode_vector(value_blob, dtype)
 
     def set(self, text: str, vector: Sequence[float]) -> None:
-        key = _hash_text(text)
-        data = pickle.dumps(vector)
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT OR REPLACE INTO embeddings (key, value, timestamp) VALUES (?, ?, ?)",
-            (key, data, time.time()),
-        )
-        self.conn.commit()
+        key = hash_text(text, self.hash_algorithm)
+        data = _encode_vector(vector, self.dtype)
+        with self._pool.write() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO embeddings (key, value, timestamp, dtype) VALUES (?, ?, ?, ?)",
+                (key, data, time.time(), self.dtype),
+            )
+            conn.commit()
+
+    def delete(self, texts: Sequence[str]) -> None:
+        """Remove the entries for ``texts`` (missing entries are ignored)."""
+        if not texts:
+            return
+        with self._pool.write() as conn:
+            keys = [(hash_text(text, self.hash_algorithm),) for text in texts]
+            conn.executemany("DELETE FROM embeddings WHERE key=?", keys)
+            conn.commit()
 
 
 @dataclass
 class ResponseCache:
     path: Path
     ttl: Optional[int] = None
+    readers: int = 4  # Read-only connections available to concurrent lookups
 
     def __post_init__(self) -> None:
-        self.conn = sqlite3.connect(str(self.path))
-        cur = self.conn.cursor()
-        cur.execute(
-            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT, timestamp REAL)"
-        )
-        self.conn.commit()
+        self._pool = _ConnPool(self.path, self.readers)
+        with self._pool.write() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT, timestamp REAL)"
+            )
+            conn.commit()
+            self.hash_algorithm = _key_algorithm(conn, "responses")
 
     def get(self, prompt: str) -> Optional[str]:
-        cur = self.conn.cursor()
-        cur.execute("SELECT value, timestamp FROM responses WHERE key=?", (_hash_text(prompt),))
-        row = cur.fetchone()
+        key = hash_text(prompt, self.hash_algorithm)
+        with self._pool.read() as conn:
+            row = conn.execute("SELECT value, timestamp FROM responses WHERE key=?", (key,)).fetchone()
         if not row:
             return None
         value, ts = row
         if self.ttl is not None and (time.time() - ts) > self.ttl:
             # Expired
-            cur.execute("DELETE FROM responses WHERE key=?", (_hash_text(prompt),))
-            self.conn.commit()
+            with self._pool.write() as conn:
+                conn.execute("DELETE FROM responses WHERE key=?", (key,))
+                conn.commit()
             return None
         return value
 
     def set(self, prompt: str, value: str) -> None:
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT OR REPLACE INTO responses (key, value, timestamp) VALUES (?, ?, ?)",
-            (_hash_text(prompt), value, time.time()),
-        )
-        self.conn.commit()
+        key = hash_text(prompt, self.hash_algorithm)
+        with self._pool.write() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, timestamp) VALUES (?, ?, ?)",
+                (key, value, time.time()),
+            )
+            conn.commit()
 
 
 @dataclass
@@ -130,6 +417,12 @@ class SemanticResponseCache:
     reused.  This can reduce repeated LLM calls even when users rephrase
     their requests.
 
+    Lookups run against an in-memory inner-product index over L2-normalized
+    vectors (``faiss.IndexFlatIP`` when FAISS is installed, a NumPy
+    equivalent otherwise), so cosine similarity reduces to a single dot
+    product per entry.  The index is built from SQLite on first use and
+    kept up to date by ``set``.
+
     Attributes
     ----------
     path : Path
@@ -139,14 +432,20 @@ class SemanticResponseCache:
     ttl : int | None
         Optional time‑to‑live in seconds.  Entries older than ``ttl`` are
         evicted on lookup.
+    namespace : str, optional
+        Scope of the entries this instance reads and writes.  Responses are
+        only comparable when they come from the same model and instructions,
+        so callers give each such combination its own namespace.
     """
 
     path: Path
     threshold: float = 0.95
     ttl: Optional[int] = None
+    namespace: str = ""
 
     def __post_init__(self) -> None:
-        self.conn = sqlite3.connect(str(self.path))
+        self.conn = connect(self.path)
+        self._lock = threading.RLock()
         cur = self.conn.cursor()
         cur.execute(
             """
@@ -154,43 +453,101 @@ class SemanticResponseCache:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 vector BLOB NOT NULL,
                 response TEXT NOT NULL,
-                timestamp REAL NOT NULL
+                timestamp REAL NOT NULL,
+                namespace TEXT NOT NULL DEFAULT ''
             )
             """
         )
+        columns = {row[1] for row in cur.execute("PRAGMA table_info(semantic_cache)")}
+        if "namespace" not in columns:
+            cur.execute("ALTER TABLE semantic_cache ADD COLUMN namespace TEXT NOT NULL DEFAULT ''")
+        cur.execute("CREATE INDEX IF NOT EXISTS semantic_cache_namespace ON semantic_cache (namespace, id)")
         self.conn.commit()
-
-    def _load_vectors(self) -> Tuple[np.ndarray, list[str], list[float]]:
-        """Load all cached embeddings, responses and timestamps.
+        _migrate_vectors(self.conn, "semantic_cache", "id", "vector", normalize=True)
+        # In-memory index over normalized vectors, built lazily from SQLite
+        # and rebuilt when another connection commits (``PRAGMA data_version``)
+        self._index = None
+        self._data_version: Optional[int] = None
+        self._ids: list[int] = []
+        self._responses: list[str] = []
+        self._timestamps: list[float] = []
+
+    def _load_vectors(self) -> Tuple[list[int], np.ndarray, list[str], list[float]]:
+        """Load the cached embeddings, responses and timestamps of this namespace.
 
         Returns
         -------
         tuple
-            A tuple of (matrix, responses, timestamps) where ``matrix`` is a
-            2D ``numpy.ndarray`` of shape (n, d), ``responses`` is a list of
+            A tuple of (ids, matrix, responses, timestamps) where ``ids`` are
+            the SQLite row ids, ``matrix`` is a 2D ``float32`` array of shape
+            (n, d) holding the stored unit-length vectors, ``responses`` is a list of
             response strings and ``timestamps`` is a list of float epoch
-            seconds.  If no entries exist the matrix will have shape
+            seconds.  Rows whose dimensionality differs from the first row
+            are skipped.  If no entries exist the matrix will have shape
             ``(0, 0)``.
         """
         cur = self.conn.cursor()
-        cur.execute("SELECT vector, response, timestamp FROM semantic_cache")
+        cur.execute(
+            "SELECT id, vector, response, timestamp FROM semantic_cache WHERE namespace=? ORDER BY id",
+            (self.namespace,),
+        )
         rows = cur.fetchall()
         if not rows:
-            return np.empty((0, 0)), [], []
-        vectors = []
-        responses = []
-        timestamps = []
-        for vec_blob, resp, ts in rows:
-            try:
-                vec = pickle.loads(vec_blob)
-            except Exception:
-                continue
-            vectors.append(vec)
-            responses.append(resp)
-            timestamps.append(ts)
-        # Convert to array of floats
-        matrix = np.array(vectors, dtype=float)
-        return matrix, responses, timestamps
+            return [], np.empty((0, 0), dtype=np.float32), [], []
+        width = len(rows[0][1])
+        rows = [row for row in rows if len(row[1]) == width]
+        ids = [row[0] for row in rows]
+        responses = [row[2] for row in rows]
+        timestamps = [row[3] for row in rows]
+        # Decode every BLOB into one (n, d) array in a single copy.  Stored
+        # vectors are already unit length (normalized in ``set``).
+        matrix = np.frombuffer(b"".join(row[1] for row in rows), dtype=np.float32)
+        matrix = matrix.reshape(len(rows), width // 4)
+        return ids, matrix, responses, timestamps
+
+    def _ensure_index(self) -> None:
+        """Build the in-memory similarity index from SQLite if needed.
+
+        The index is reused across lookups and only reloaded when it was
+        invalidated or when another connection (possibly in another process)
+        has committed changes to the database since it was built.
+        """
+        version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if self._index is not None and version == self._data_version:
+            return
+        self._index = None
+        self._data_version = version
+        ids, matrix, responses, timestamps = self._load_vectors()
+        if matrix.size == 0:
+            return
+        self._index = _new_flat_index(matrix.shape[1])
+        self._index.add(matrix)
+        self._ids = ids
+        self._responses = responses
+        self._timestamps = timestamps
+
+    def _append(
+        self,
+        ids: Sequence[int],
+        vectors: Sequence[Sequence[float]],
+        responses: Sequence[str],
+        timestamps: Sequence[float],
+    ) -> None:
+        """Add freshly inserted (already normalized) rows to the in-memory index."""
+        if self._index is None or not ids:
+            # Loaded lazily (including these rows) on the next lookup
+            return
+        try:
+            matrix = np.vstack(vectors)
+        except ValueError:
+            matrix = None
+        if matrix is None or matrix.shape[1] != self._index.d:
+            self._index = None
+            return
+        self._index.add(matrix)
+        self._ids.extend(ids)
+        self._responses.extend(responses)
+        self._timestamps.extend(timestamps)
 
     def get(self, embedding: Sequence[float]) -> Optional[str]:
         """Retrieve the cached response whose embedding is most similar.
@@ -206,33 +563,26 @@ class SemanticResponseCache:
             Cached response if a similar embedding above the threshold is
             found and the entry is not expired; otherwise ``None``.
         """
-        emb = np.array(embedding, dtype=float)
-        # Load existing vectors and responses
-        matrix, responses, timestamps = self._load_vectors()
-        if matrix.size == 0:
-            return None
-        # Compute cosine similarities: (v · e) / (||v|| * ||e||)
-        # Add small epsilon to avoid division by zero
-        try:
-            e_norm = np.linalg.norm(emb) + 1e-9
-            v_norms = np.linalg.norm(matrix, axis=1) + 1e-9
-            sims = (matrix @ emb) / (v_norms * e_norm)
-        except Exception:
-            return None
-        # Find index of highest similarity
-        idx = int(np.argmax(sims))
-        sim = float(sims[idx])
-        # Check threshold and TTL
-        if sim >= self.threshold:
-            ts = timestamps[idx]
+        with self._lock:
+            self._ensure_index()
+            if self._index is None or self._index.ntotal == 0:
+                return None
+            query = _normalize_rows(np.array(embedding, dtype=np.float32).reshape(1, -1))
+            if query.shape[1] != self._index.d:
+                return None
+            # Vectors are unit length, so the inner product is the cosine similarity
+            idx, _ = _best_above(self._index, query, self.threshold)
+            if idx < 0:
+                return None
+            ts = self._timestamps[idx]
             if self.ttl is not None and (time.time() - ts) > self.ttl:
-                # expired entry; remove
+                # expired entry; remove and rebuild the index on next lookup
                 cur = self.conn.cursor()
-                cur.execute("DELETE FROM semantic_cache WHERE rowid=?", (idx + 1,))
+                cur.execute("DELETE FROM semantic_cache WHERE id=?", (self._ids[idx],))
                 self.conn.commit()
+                self._index = None
                 return None
-            return responses[idx]
-        return None
+            return self._responses[idx]
 
     def set(self, embedding: Sequence[float], response: str) -> None:
         """Store an embedding and its response in the semantic cache.
@@ -244,13 +594,16 @@ class SemanticResponseCache:
         response : str
             The LLM response text.
         """
-        vec_blob = pickle.dumps(list(embedding))
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO semantic_cache (vector, response, timestamp) VALUES (?, ?, ?)",
-            (vec_blob, response, time.time()),
-        )
-        self.conn.commit()
+        vec = _normalize_rows(np.array(embedding, dtype=np.float32).reshape(1, -1))
+        now = time.time()
+        with self._lock:
+            cur = self.conn.cursor()
+            cur.execute(
+                "INSERT INTO semantic_cache (vector, response, timestamp, namespace) VALUES (?, ?, ?, ?)",
+                (_encode_vector(vec), response, now, self.namespace),
+            )
+            self.conn.commit()
+            self._append([cur.lastrowid], [vec], [response], [now])
 
     def warm_up(self, entries: Sequence[Tuple[Sequence[float], str]]) -> None:
         """Bulk load entries into the semantic cache.
@@ -259,19 +612,38 @@ class SemanticResponseCache:
         historical data (e.g. commonly asked queries and their answers),
         improving hit rates and reducing initial API usage.
 
+        Rows are inserted with ``executemany`` in transactions of up to
+        10,000 entries each.
+
         Parameters
         ----------
         entries : Sequence[tuple]
             A sequence of (embedding, response) tuples.
         """
-        cur = self.conn.cursor()
-        for emb, resp in entries:
-            try:
-                vec_blob = pickle.dumps(list(emb))
-                cur.execute(
-                    "INSERT INTO semantic_cache (vector, response, timestamp) VALUES (?, ?, ?)",
-                    (vec_blob, resp, time.time()),
-                )
-            except Exception:
+        it = iter(entries)
+        while True:
+            chunk = list(itertools.islice(it, _WARM_UP_BATCH))
+            if not chunk:
+                break
+            vectors, rows = [], []
+            now = time.time()
+            for emb, resp in chunk:
+                try:
+                    vec = _normalize_rows(np.array(emb, dtype=np.float32).reshape(1, -1))
+                except Exception:
+                    continue
+                rows.append((_encode_vector(vec), resp, now, self.namespace))
+                vectors.append(vec)
+            if not rows:
                 continue
-        self.conn.commit()
\ No newline at end of file
+            with self._lock:
+                cur = self.conn.cursor()
+                cur.executemany(
+                    "INSERT INTO semantic_cache (vector, response, timestamp, namespace) VALUES (?, ?, ?, ?)",
+                    rows,
+                )
+                # Still inside the write transaction, so the newest ids are ours
+                cur.execute("SELECT id FROM semantic_cache ORDER BY id DESC LIMIT ?", (len(rows),))
+                ids = [row_id for (row_id,) in reversed(cur.fetchall())]
+                self.conn.commit()
+                self._append(ids, vectors, [r[1] for r in rows], [now] * len(rows))
@@ -26,10 +26,12 @@ should be cached and reused across sessions (see `obskg.cache`).
 
 from __future__ import annotations
 
+import functools
 import logging
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
-from functools import lru_cache
-from typing import List, Optional, Sequence
+from typing import List, Optional, Sequence, Tuple
 
 try:
     import numpy as np
@@ -56,6 +58,7 @@ class EmbeddingConfig:
     model: str = "text-embedding-3-small"
     api_key: Optional[str] = None
     device: Optional[str] = None  # used for local models
+    batch_size: int = 64  # encode batch size for local models
 
 
 def _to_array(vec: Sequence[float]):
@@ -64,12 +67,57 @@ def _to_array(vec: Sequence[float]):
     return list(vec)
 
 
-@lru_cache(maxsize=None)
+# Inputs sent per OpenAI embeddings request
+OPENAI_BATCH_SIZE = 512
+
+
+@functools.lru_cache(maxsize=8)
+def openai_client(api_key: str):
+    """Return a shared OpenAI client for ``api_key``.
+
+    The client is thread-safe and keeps its HTTP connection pool alive, so
+    reusing it saves a TCP/TLS handshake per request.
+    """
+    if OpenAI is None:
+        raise RuntimeError("OpenAI SDK is not installed")
+    return OpenAI(api_key=api_key)
+
+
+# Loaded local models keyed by (model name, device), least recently used first.
+# Models can take hundreds of MB of (GPU) memory, so only a few are kept.
+MAX_LOCAL_MODELS = 2
+_MODEL_CACHE: "OrderedDict[Tuple[str, Optional[str]], object]" = OrderedDict()
+_MODEL_LOCK = threading.Lock()
+
+
 def _load_local_model(model_name: str, device: Optional[str] = None):
-    """Load a local sentence transformer model (cached)."""
+    """Load a local sentence transformer model (cached, LRU-evicted).
+
+    ``device=None`` lets sentence-transformers pick a device (CUDA when
+    available), so it is cached separately from an explicit ``"cpu"``.
+    Loading happens under the cache lock, so concurrent callers asking for
+    the same model wait for one load instead of each loading a copy.
+    """
     if SentenceTransformer is None:
         raise RuntimeError("sentence_transformers is not installed")
-    return SentenceTransformer(model_name, device=device)
+    key = (model_name, device)
+    with _MODEL_LOCK:
+        model = _MODEL_CACHE.get(key)
+        if model is not None:
+            _MODEL_CACHE.move_to_end(key)
+            return model
+        model = SentenceTransformer(model_name, device=device)
+        _MODEL_CACHE[key] = model
+        while len(_MODEL_CACHE) > MAX_LOCAL_MODELS:
+            evicted, _ = _MODEL_CACHE.popitem(last=False)
+            logger.debug("Evicting local embedding model %s", evicted)
+    return model
+
+
+def clear_models() -> None:
+    """Drop all cached local models so their memory can be reclaimed."""
+    with _MODEL_LOCK:
+        _MODEL_CACHE.clear()
 
 
 def embed_texts(texts: List[str], config: EmbeddingConfig) -> List[Sequence[float]]:
@@ -91,9 +139,10 @@ def embed_texts(texts: List[str], config: EmbeddingConfig) -> List[Sequence[floa
 
     Notes
     -----
-    This function does not implement batching or rate limiting.  When
-    embedding a large corpus, callers should chunk the input and sleep
-    between batches to respect provider quotas and avoid timeouts.
+    OpenAI requests are sent ``OPENAI_BATCH_SIZE`` texts at a time over a
+    shared client; results keep the input order.  No rate limiting is
+    done, so callers embedding a large corpus may still need to pace their
+    calls to respect provider quotas.
     """
     if not texts:
         return []
@@ -102,18 +151,28 @@ def embed_texts(texts: List[str], config: EmbeddingConfig) -> List[Sequence[floa
             raise RuntimeError("OpenAI SDK is not installed")
         if not config.api_key:
             raise ValueError("OpenAI API key must be supplied when using OpenAI embeddings")
-        client = OpenAI(api_key=config.api_key)
-        # The OpenAI embeddings API accepts up to 8191 input tokens per call.
-        # We rely on the SDK to batch internally when given a list.
-        response = client.embeddings.create(input=texts, model=config.model)
-        vectors = [record.embedding for record in response.data]
+        client = openai_client(config.api_key)
+        vectors = []
+        for start in range(0, len(texts), OPENAI_BATCH_SIZE):
+            batch = texts[start:start + OPENAI_BATCH_SIZE]
+            response = client.embeddings.create(input=batch, model=config.model)
+            vectors.extend(record.embedding for record in response.data)
         return [_to_array(v) for v in vectors]
     elif config.provider.lower() == "local":
         # Use a local sentence transformer (e.g., all-MiniLM-L6-v2)
         model = _load_local_model(config.model, device=config.device)
-        vectors = model.encode(texts, convert_to_numpy=np is not None)
+        # Unit-length output lets cosine-similarity indexes skip normalization
+        vectors = model.encode(
+            texts,
+            batch_size=config.batch_size,
+            convert_to_numpy=np is not None,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        )
         if np is None:
             return [list(v) for v in vectors]
-        return [v.astype(np.float32) for v in vectors]
+        # One contiguous (n, d) matrix; the returned rows are views into it
+        matrix = np.ascontiguousarray(vectors, dtype=np.float32)
+        return list(matrix)
     else:
         raise ValueError(f"Unsupported embedding provider: {config.provider}")
\ No newline at end of file
@@ -14,20 +14,36 @@ database (e.g. InfluxDB) or expose them via a monitoring API.
 from __future__ import annotations
 
 import time
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Dict
+
+
+@dataclass
+class RunningMean:
+    """Sum and count of the values recorded for one metric."""
+
+    total: float = 0.0
+    count: int = 0
+
+    def add(self, value: float) -> None:
+        self.total += value
+        self.count += 1
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
 
 
 class MetricsCollector:
     """Collect and report key performance indicators."""
 
     def __init__(self) -> None:
-        self.metrics: Dict[str, List[float]] = {
-            "TTI": [],
-            "KRR": [],
-            "SV": [],
-            "CLI": [],
-            "AAR": [],
-        }
+        # Running sum and count per metric so memory and reporting stay
+        # O(1) no matter how many queries are tracked.
+        self.metrics: Dict[str, RunningMean] = {key: RunningMean() for key in ("TTI", "KRR", "SV", "CLI", "AAR")}
+
+    def _record(self, key: str, value: float) -> None:
+        self.metrics[key].add(value)
 
     def track_query(self, start_time: float, end_time: float, notes_accessed: int) -> None:
         """Record metrics for a single query.
@@ -43,18 +59,18 @@ class MetricsCollector:
         """
         duration = end_time - start_time
         # Time to Insight: raw duration in seconds
-        self.metrics["TTI"].append(duration)
+        self._record("TTI", duration)
         # Knowledge Reuse Rate: ratio of cached responses used (placeholder)
-        self.metrics["KRR"].append(0.0)
+        self._record("KRR", 0.0)
         # Synthesis Velocity: notes per second processed (placeholder)
         if duration > 0:
-            self.metrics["SV"].append(notes_accessed / duration)
+            self._record("SV", notes_accessed / duration)
         else:
-            self.metrics["SV"].append(0.0)
+            self._record("SV", 0.0)
         # Cognitive Load Index: inverse of notes processed (simplified)
-        self.metrics["CLI"].append(1.0 / max(1, notes_accessed))
+        self._record("CLI", 1.0 / max(1, notes_accessed))
         # AI Augmentation Rate: proportion of AI involvement (placeholder)
-        self.metrics["AAR"].append(0.5)
+        self._record("AAR", 0.5)
 
     def generate_report(self) -> Dict[str, float]:
         """Summarise metrics for reporting.
@@ -64,10 +80,4 @@ class MetricsCollector:
         dict
             A dictionary of average values for each tracked metric.
         """
-        report = {}
-        for key, values in self.metrics.items():
-            if values:
-                report[key] = sum(values) / len(values)
-            else:
-                report[key] = 0.0
-        return report
\ No newline at end of file
+        return {key: running.mean for key, running in self.metrics.items()}
\ No newline at end of file
@@ -13,7 +13,8 @@ based on simple heuristics and does not maintain real usage history.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Sequence
+from itertools import groupby
+from typing import Any, Dict, List, Optional, Sequence
 
 
 @dataclass
@@ -71,24 +72,42 @@ class CostOptimizer:
         }
         return mapping.get(task_type, "gpt-3.5-turbo")
 
-    def batch_operations(self, operations: Sequence[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:  # type: ignore[name-defined]
+    def batch_operations(
+        self,
+        operations: Sequence[Dict[str, Any]],
+        max_batch_tokens: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
         """Group operations into batches to benefit from bulk pricing.
 
         Parameters
         ----------
         operations : sequence of dict
             Operations to be performed, each with a ``model`` and
-            ``complexity``.  This simplified implementation groups
-            operations by model name.
+            ``complexity`` and optionally a ``token_estimate``.
+        max_batch_tokens : int, optional
+            Upper bound on the summed ``token_estimate`` of a batch, so that
+            each batch fits the provider's per-request budget.  An operation
+            larger than the limit gets a batch of its own.
 
         Returns
         -------
         list of list
             A list where each element is a batch (list) of operations
-            using the same model.
+            using the same model.  Batches are ordered by model name and,
+            within a model, by descending complexity.
         """
-        batches: Dict[str, List[Dict[str, Any]]] = {}
-        for op in operations:
-            model = op.get("model", "gpt-3.5-turbo")
-            batches.setdefault(model, []).append(op)
-        return list(batches.values())
\ No newline at end of file
+        keyed = [(op.get("model", "gpt-3.5-turbo"), op) for op in operations]
+        keyed.sort(key=lambda item: (item[0], -item[1].get("complexity", 0.0)))
+        batches: List[List[Dict[str, Any]]] = []
+        for _, group in groupby(keyed, key=lambda item: item[0]):
+            batch: List[Dict[str, Any]] = []
+            tokens = 0
+            for _, op in group:
+                cost = op.get("token_estimate", 0)
+                if batch and max_batch_tokens is not None and tokens + cost > max_batch_tokens:
+                    batches.append(batch)
+                    batch, tokens = [], 0
+                batch.append(op)
+                tokens += cost
+            batches.append(batch)
+        return batches
\ No newline at end of file
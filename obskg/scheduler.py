@@ -22,16 +22,24 @@ from __future__ import annotations
 
 import os
 import subprocess
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Dict, Optional, Tuple
 
 try:
     from watchdog.observers import Observer
-    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers.api import ObservedWatch
+    from watchdog.events import PatternMatchingEventHandler
 except ImportError:  # pragma: no cover
     Observer = None  # type: ignore
-    FileSystemEventHandler = object  # type: ignore
+    ObservedWatch = None  # type: ignore
+    PatternMatchingEventHandler = object  # type: ignore
+
+
+# One observer thread serves every watched vault; created on first use
+_observer: Optional[Observer] = None
+_observer_lock = threading.Lock()
 
 
 def cron_schedule(script_path: Path, interval_minutes: int = 60) -> str:
@@ -82,28 +90,111 @@ def launchd_plist(label: str, script_path: Path, interval_minutes: int = 60) ->
 """
 
 
-class VaultEventHandler(FileSystemEventHandler):  # pragma: no cover
-    """Watchdog event handler that triggers a callback when a .md file changes."""
+class VaultEventHandler(PatternMatchingEventHandler):
+    """Watchdog event handler that triggers a callback when a .md file changes.
 
-    def __init__(self, callback: Callable[[Path], None]) -> None:
-        super().__init__()
+    Editors usually write a note several times per save (temporary file,
+    rename, truncate), so events are debounced per path: the callback runs
+    once, ``debounce`` seconds after the last event for that file.  Hidden
+    files, editor backups (``*~``) and anything inside a hidden directory
+    of ``root`` (``.obsidian``, ``.trash`` ...) are ignored.
+    """
+
+    def __init__(self, callback: Callable[[Path], None], debounce: float = 0.5, root: Optional[Path] = None) -> None:
+        super().__init__(
+            patterns=["*.md"], ignore_patterns=[".*", "*~", "*/.obsidian/*"], ignore_directories=True, case_sensitive=False
+        )
         self.callback = callback
+        self.debounce = debounce
+        # Resolved so event paths match whether the vault was given relative,
+        # through a symlink or (on macOS) as /var rather than /private/var
+        self.root = root.resolve() if root is not None else None
+        self._pending: Dict[Path, threading.Timer] = {}
+        self._lock = threading.Lock()
 
     def on_modified(self, event) -> None:
-        if not event.is_directory and event.src_path.endswith('.md'):
-            self.callback(Path(event.src_path))
+        self._schedule(event.src_path)
 
     def on_created(self, event) -> None:
-        if not event.is_directory and event.src_path.endswith('.md'):
-            self.callback(Path(event.src_path))
-
+        self._schedule(event.src_path)
+
+    def on_moved(self, event) -> None:
+        # Atomic saves write a temporary file and rename it over the note
+        self._schedule(event.dest_path)
+
+    def _schedule(self, src_path: str) -> None:
+        path = Path(src_path)
+        if not path.name.lower().endswith(".md") or path.name.startswith("."):
+            return
+        parts = self._relative_parts(path)
+        if parts is None or any(part.startswith(".") for part in parts[:-1]):
+            return
+        with self._lock:
+            timer = self._pending.get(path)
+            if timer is not None:
+                timer.cancel()
+            timer = threading.Timer(self.debounce, self._fire, args=(path,))
+            timer.daemon = True
+            self._pending[path] = timer
+            timer.start()
+
+    def _relative_parts(self, path: Path) -> Optional[Tuple[str, ...]]:
+        """Return the components of ``path`` below ``root``, or ``None`` if outside it.
+
+        This runs on the observer thread shared by every watched vault, so
+        it must not raise for a path it cannot place.
+        """
+        if self.root is None:
+            return path.parts
+        for candidate in (path, path.resolve()):
+            try:
+                return candidate.relative_to(self.root).parts
+            except ValueError:
+                continue
+        return None
+
+    def _fire(self, path: Path) -> None:
+        with self._lock:
+            # A newer event may already have replaced this timer
+            if self._pending.get(path) is threading.current_thread():
+                del self._pending[path]
+        self.callback(path)
+
+
+def _shared_observer() -> Observer:  # pragma: no cover
+    global _observer
+    with _observer_lock:
+        if _observer is None:
+            _observer = Observer()
+            _observer.daemon = True
+            _observer.start()
+        return _observer
+
+
+def watch_vault(  # pragma: no cover
+    vault_path: Path, callback: Callable[[Path], None], debounce: float = 0.5
+) -> ObservedWatch:
+    """Watch a vault directory and trigger callback on Markdown changes.
+
+    All vaults are watched by a single process-wide observer thread (one
+    thread and one inotify/FSEvents instance however many vaults are
+    watched).  ``callback`` is called once per changed note after
+    ``debounce`` seconds without further events for it.
 
-def watch_vault(vault_path: Path, callback: Callable[[Path], None]) -> Optional[Observer]:  # pragma: no cover
-    """Watch a vault directory and trigger callback on Markdown changes."""
+    Returns
+    -------
+    ObservedWatch
+        Handle that can be passed to :func:`unwatch_vault`.
+    """
     if Observer is None:
         raise RuntimeError("watchdog is not installed")
-    event_handler = VaultEventHandler(callback)
-    observer = Observer()
-    observer.schedule(event_handler, str(vault_path), recursive=True)
-    observer.start()
-    return observer
\ No newline at end of file
+    vault_path = Path(vault_path)
+    event_handler = VaultEventHandler(callback, debounce=debounce, root=vault_path)
+    return _shared_observer().schedule(event_handler, str(vault_path), recursive=True)
+
+
+def unwatch_vault(watch: ObservedWatch) -> None:  # pragma: no cover
+    """Stop watching a vault scheduled with :func:`watch_vault`."""
+    with _observer_lock:
+        if _observer is not None:
+            _observer.unschedule(watch)
\ No newline at end of file
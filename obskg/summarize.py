@@ -33,15 +33,19 @@ print(summary)
 
 from __future__ import annotations
 
+import functools
+import json
 import logging
 import math
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Callable, List, Optional
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
 
-try:
-    from openai import OpenAI
-except ImportError:  # pragma: no cover
-    OpenAI = None  # type: ignore
+from .cache import ResponseCache, SemanticResponseCache
+from .embeddings import EmbeddingConfig, embed_texts, openai_client
 
 
 logger = logging.getLogger(__name__)
@@ -55,33 +59,175 @@ class SummarizationConfig:
     temperature: float = 0.3
     max_tokens: int = 1024
     system_prompt: Optional[str] = None
+    max_concurrency: int = 4  # parallel chunk requests in summarize_document
+    chunk_overlap_sentences: int = 3  # sentences repeated at the start of each chunk
+    # Drop near-duplicate sentences (Jaccard similarity of word 3-grams above
+    # this value) from chunk summaries before the reduce call; None disables
+    dedup_threshold: Optional[float] = 0.75
+    reduce_group_size: int = 5  # summaries combined per reduce call
+    # Response caching (disabled unless ``cache_path`` is set)
+    cache_path: Optional[str] = None
+    cache_ttl: Optional[int] = None
+    # Semantic matching of paraphrased prompts; requires an embedding config
+    # and is only used for near-deterministic calls (temperature < 0.3)
+    embedding: Optional[EmbeddingConfig] = None
+    semantic_threshold: float = 0.95
 
 
-def _chunk_text(text: str, max_chars: int = 4000) -> List[str]:
-    """Chunk a long string into approximately equal parts without splitting words."""
-    words = text.split()
+# Open caches keyed by (path, ttl, threshold, semantic namespace or None)
+_CACHES: Dict[Tuple, Tuple[ResponseCache, Optional[SemanticResponseCache]]] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def _caches_for(config: SummarizationConfig) -> Tuple[ResponseCache, Optional[SemanticResponseCache]]:
+    namespace = None
+    if config.embedding is not None and config.temperature < 0.3:
+        # A paraphrase only shares an answer when asked of the same model
+        # with the same instructions and length limit, and embeddings are
+        # only comparable within one embedding model
+        namespace = json.dumps([config.model, config.system_prompt, config.max_tokens, config.embedding.model])
+    key = (config.cache_path, config.cache_ttl, config.semantic_threshold, namespace)
+    with _CACHES_LOCK:
+        if key not in _CACHES:
+            path = Path(config.cache_path)  # type: ignore[arg-type]
+            semantic = None
+            if namespace is not None:
+                semantic = SemanticResponseCache(
+                    path=path, threshold=config.semantic_threshold, ttl=config.cache_ttl, namespace=namespace
+                )
+            _CACHES[key] = (ResponseCache(path=path, ttl=config.cache_ttl), semantic)
+        return _CACHES[key]
+
+
+def _cached(call: Callable[[str, SummarizationConfig], str]) -> Callable[[str, SummarizationConfig], str]:
+    """Serve completions from a two-tier cache when ``config.cache_path`` is set.
+
+    The exact tier keys on the model, temperature, system prompt, token
+    limit and prompt.
+    On a miss, and only for low-temperature calls with an embedding config,
+    the prompt is embedded and looked up in a semantic cache, scoped to the
+    model, system prompt and token limit, so paraphrased prompts can reuse an earlier
+    answer.  Fresh responses are written to
+    both tiers.
+    """
+
+    @functools.wraps(call)
+    def wrapper(prompt: str, config: SummarizationConfig) -> str:
+        if config.cache_path is None:
+            return call(prompt, config)
+        exact, semantic = _caches_for(config)
+        key = json.dumps([config.model, config.temperature, config.system_prompt, config.max_tokens, prompt])
+        response = exact.get(key)
+        if response is not None:
+            return response
+        embedding = None
+        if semantic is not None:
+            embedding = embed_texts([prompt], config.embedding)[0]  # type: ignore[arg-type]
+            response = semantic.get(embedding)
+            if response is not None:
+                return response
+        response = call(prompt, config)
+        exact.set(key, response)
+        if semantic is not None:
+            semantic.set(embedding, response)  # type: ignore[arg-type]
+        return response
+
+    return wrapper
+
+
+# Separators that end a sentence; the split happens after the first character
+_SENTENCE_ENDS = (". ", "! ", "? ", "\n")
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_WORD = re.compile(r"\w+")
+
+
+def _shingles(sentence: str, n: int = 3) -> frozenset:
+    words = _WORD.findall(sentence.lower())
+    if len(words) < n:
+        return frozenset([tuple(words)])
+    return frozenset(zip(*(words[i:] for i in range(n))))
+
+
+def _dedup_summaries(summaries: List[str], threshold: float) -> List[str]:
+    """Remove sentences that nearly repeat an earlier sentence.
+
+    Each sentence is reduced to its set of word 3-grams and dropped when its
+    Jaccard similarity with a sentence already kept (from this or an
+    earlier summary) exceeds ``threshold``.  Summaries left empty are
+    removed.
+    """
+    kept: List[frozenset] = []
+    result: List[str] = []
+    for summary in summaries:
+        sentences = []
+        for sentence in _SENTENCE_SPLIT.split(summary):
+            shingles = _shingles(sentence)
+            if any(len(shingles & other) / len(shingles | other) > threshold for other in kept):
+                continue
+            kept.append(shingles)
+            sentences.append(sentence)
+        if sentences:
+            result.append(" ".join(sentences))
+    return result
+
+
+def _last_sentence_end(text: str, start: int, end: int) -> int:
+    """Return the index just past the last sentence end in ``text[start:end]``, or -1."""
+    pos = max(text.rfind(sep, start, end) for sep in _SENTENCE_ENDS)
+    return pos + 1 if pos >= 0 else -1
+
+
+def _chunk_text(text: str, max_chars: int = 4000, overlap_sentences: int = 0) -> List[str]:
+    """Chunk a long string into parts of at most ``max_chars`` characters.
+
+    The text is scanned by character offset rather than split into words,
+    so no per-word objects are created.  Each chunk ends at the last
+    sentence boundary in its second half if there is one, otherwise at the
+    last whitespace, and is only cut mid-word when it contains no
+    whitespace at all.  ``max_chars`` below 1 is treated as 1.  With
+    ``overlap_sentences`` > 0, each chunk starts up to that many sentences
+    before the end of the previous one so context is kept across
+    boundaries; the overlap never reaches back to the previous chunk's start
+    or over more than half of ``max_chars``, so every chunk starts strictly
+    after the one before it and ends beyond it.
+    """
+    max_chars = max(1, max_chars)
     chunks: List[str] = []
-    current: List[str] = []
-    count = 0
-    for w in words:
-        count += len(w) + 1
-        if count > max_chars:
-            chunks.append(" ".join(current))
-            current = [w]
-            count = len(w) + 1
-        else:
-            current.append(w)
-    if current:
-        chunks.append(" ".join(current))
+    n = len(text)
+    start = 0
+    while start < n:
+        # Skip leading whitespace
+        while start < n and text[start].isspace():
+            start += 1
+        if start >= n:
+            break
+        end = min(start + max_chars, n)
+        if end < n:
+            boundary = _last_sentence_end(text, start + max_chars // 2, end)
+            if boundary < 0:
+                boundary = max(text.rfind(" ", start, end), text.rfind("\n", start, end))
+            if boundary > start:
+                end = boundary
+        chunks.append(text[start:end].rstrip())
+        if end >= n:
+            break
+        next_start = end
+        limit = max(start + 1, end - max_chars // 2)
+        for _ in range(overlap_sentences):
+            boundary = _last_sentence_end(text, limit, next_start - 1)
+            if boundary <= limit:
+                break
+            next_start = boundary
+        start = next_start
     return chunks
 
 
+@_cached
 def _call_openai(prompt: str, config: SummarizationConfig) -> str:
-    if OpenAI is None:
-        raise RuntimeError("OpenAI SDK is not installed")
     if not config.api_key:
         raise ValueError("OpenAI API key is required for summarization")
-    client = OpenAI(api_key=config.api_key)
+    client = openai_client(config.api_key)
     messages = []
     if config.system_prompt:
         messages.append({"role": "system", "content": config.system_prompt})
@@ -106,8 +252,12 @@ def summarize_document(
     The input text is split into smaller chunks to satisfy the context window
     limits of the underlying model (OpenAI GPT models have limits between
     16 k and 400 k tokens depending on the tier).  Each chunk is summarized
-    separately and then the summaries are concatenated and summarized again
-    to produce a final result.
+    separately, and the summaries are then combined in a reduce tree: groups
+    of ``config.reduce_group_size`` summaries are summarized together, level
+    by level, until one remains.  Each reduce call therefore has a bounded
+    input however long the document is.  Calls within a level (and all
+    chunk summaries) are independent, so up to ``config.max_concurrency``
+    of them are requested in parallel.
 
     Parameters
     ----------
@@ -122,20 +272,39 @@ def summarize_document(
 
     Returns
     -------
-    A string containing the final summary.
+    A string containing the final summary (empty for blank input).
     """
     # Heuristic to approximate character limit for given max_tokens (1 token ~ 4 chars)
     approx_chars_per_chunk = (max_tokens - 100) * 4
-    chunks = _chunk_text(text, max_chars=approx_chars_per_chunk)
+    chunks = _chunk_text(text, max_chars=approx_chars_per_chunk, overlap_sentences=config.chunk_overlap_sentences)
     logger.debug("Splitting document into %d chunks", len(chunks))
-    partial_summaries: List[str] = []
-    for i, chunk in enumerate(chunks):
-        chunk_prompt = f"{prompt}\n\n{chunk}"
-        summary = _call_openai(chunk_prompt, config)
-        partial_summaries.append(summary.strip())
-    if len(partial_summaries) == 1:
-        return partial_summaries[0]
-    # Reduce: summarize the summaries
-    combined = "\n\n".join(partial_summaries)
-    final_prompt = f"Combine the following summaries into a coherent summary:\n\n{combined}"
-    return _call_openai(final_prompt, config).strip()
\ No newline at end of file
+    if not chunks:
+        return ""
+    with ThreadPoolExecutor(max_workers=max(1, config.max_concurrency)) as executor:
+        # ``map`` yields results in chunk order regardless of completion order
+        summaries = executor.map(lambda chunk: _call_openai(f"{prompt}\n\n{chunk}", config), chunks)
+        partial_summaries: List[str] = [summary.strip() for summary in summaries]
+        if len(partial_summaries) == 1:
+            return partial_summaries[0]
+        # Reduce: summarize the summaries, minus content repeated across chunks
+        if config.dedup_threshold is not None:
+            partial_summaries = _dedup_summaries(partial_summaries, config.dedup_threshold)
+        return _reduce(partial_summaries, config, executor)
+
+
+def _reduce(summaries: List[str], config: SummarizationConfig, executor: ThreadPoolExecutor) -> str:
+    """Combine summaries level by level until a single summary remains."""
+    if not summaries:
+        return ""
+    group_size = max(2, config.reduce_group_size)
+
+    def combine(group: List[str]) -> str:
+        if len(group) == 1:
+            return group[0]  # Nothing to combine at this level
+        combined = "\n\n".join(group)
+        return _call_openai(f"Combine the following summaries into a coherent summary:\n\n{combined}", config).strip()
+
+    while len(summaries) > 1:
+        groups = [summaries[i:i + group_size] for i in range(0, len(summaries), group_size)]
+        summaries = list(executor.map(combine, groups))
+    return summaries[0]
\ No newline at end of file
@@ -36,17 +36,45 @@ Design considerations
 
 from __future__ import annotations
 
+import logging
+import os
 import re
 import unicodedata
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 try:
     import yaml
 except ImportError:  # pragma: no cover
     yaml = None  # type: ignore
 
+try:
+    import pathspec
+except ImportError:  # pragma: no cover
+    pathspec = None  # type: ignore
+
+
+logger = logging.getLogger(__name__)
+
+# Gitignore-style files read from each vault root
+IGNORE_FILES = (".gitignore", ".obsidianignore")
+
+if yaml is not None:
+    # libyaml's C parser is several times faster than the pure-Python one
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    _yaml_resolver = yaml.resolver.Resolver()
+
+# Front matter: a leading '---' line up to the next line consisting of '---'.
+# Matching whole delimiter lines keeps '---' inside values or horizontal
+# rules such as '----' from ending the block early.
+_FRONT_MATTER_RE = re.compile(r"\A---[ \t]*\n(.*?)^---[ \t]*(?:\n|\Z)", re.DOTALL | re.MULTILINE)
+
+# Characters that make a front matter block more than flat ``key: text`` pairs
+_YAML_SPECIAL = frozenset("{}[]&*!|>'\"%@`#\t")
+_FAST_PATH_MAX_LINES = 20
+_STR_TAG = "tag:yaml.org,2002:str"
+
 
 @dataclass
 class Note:
@@ -57,6 +85,51 @@ class Note:
     title: str
     content: str
     front_matter: Dict[str, object]
+    mtime: float = 0.0
+    size: int = 0
+
+
+@dataclass
+class NoteMeta:
+    """Location and ``stat`` data of a note, gathered without reading it."""
+
+    vault: str
+    path: Path
+    mtime: float
+    size: int
+
+
+def _is_plain_str(scalar: str) -> bool:
+    """Return True if YAML would load ``scalar`` as this exact plain string."""
+    return (
+        scalar == scalar.strip()
+        and scalar[:1] not in ("", "-", "?", ":", ",")
+        and ": " not in scalar
+        and not scalar.endswith(":")
+        and _yaml_resolver.resolve(yaml.ScalarNode, scalar, (True, False)) == _STR_TAG
+    )
+
+
+def _load_front_matter(text: str) -> Dict[str, object]:
+    """Parse a front matter block with YAML, avoiding the parser when possible.
+
+    Most notes carry a few flat ``key: value`` lines of plain text.  Those
+    are split directly; the same implicit-type resolver YAML uses confirms
+    that every key and value would load as a plain string, so the result is
+    identical.  Anything else (lists, nesting, quoting, numbers, dates,
+    booleans, comments ...) goes through ``yaml.load`` with the C loader.
+    """
+    lines = text.splitlines()
+    if len(lines) < _FAST_PATH_MAX_LINES and not _YAML_SPECIAL.intersection(text):
+        data: Dict[str, object] = {}
+        for line in lines:
+            key, sep, value = line.partition(": ")
+            if not sep or not _is_plain_str(key) or not _is_plain_str(value):
+                break
+            data[key] = value
+        else:
+            return data
+    return yaml.load(text, Loader=_YamlLoader) or {}
 
 
 def _parse_front_matter(text: str) -> Tuple[Dict[str, object], str]:
@@ -74,24 +147,139 @@ def _parse_front_matter(text: str) -> Tuple[Dict[str, object], str]:
     installed, an empty dict is returned and the original text is returned
     unchanged.
     """
-    if not text.startswith("---\n"):
-        return {}, text
     if yaml is None:
         return {}, text
-    # Split on the second '---' line
-    parts = text.split("\n---", 1)
-    if len(parts) < 2:
+    match = _FRONT_MATTER_RE.match(text)
+    if match is None:
         return {}, text
-    front_matter_text = parts[0].strip("-\n")
-    body = parts[1].lstrip('\n')
+    body = text[match.end():].lstrip("\n")
     try:
-        data = yaml.safe_load(front_matter_text) or {}
+        data = _load_front_matter(match.group(1))
     except Exception:
         data = {}
     return data, body
 
 
-def iter_notes(vaults: Iterable[Path]) -> Iterator[Note]:
+def _to_nfc(text: str) -> str:
+    """Return ``text`` in NFC, skipping the normalization tables when possible.
+
+    Pure ASCII text (``str.isascii`` is O(1) for CPython's compact ASCII
+    strings) and text that passes the ``is_normalized`` quick check are
+    returned unchanged.
+    """
+    if text.isascii() or unicodedata.is_normalized("NFC", text):
+        return text
+    return unicodedata.normalize("NFC", text)
+
+
+def _load_ignore_spec(root: Path) -> Optional["pathspec.PathSpec"]:
+    """Compile the vault's ``.gitignore``/``.obsidianignore`` patterns, if any."""
+    lines: List[str] = []
+    for name in IGNORE_FILES:
+        try:
+            lines.extend((root / name).read_text(encoding="utf-8").splitlines())
+        except (OSError, UnicodeDecodeError):
+            continue
+    if not lines:
+        return None
+    if pathspec is None:
+        logger.warning("pathspec is not installed; ignore files in %s are not applied", root)
+        return None
+    return pathspec.GitIgnoreSpec.from_lines(lines)
+
+
+def _iter_markdown_files(root: Path, ignore: Optional["pathspec.PathSpec"] = None) -> Iterator[os.DirEntry]:
+    """Yield ``.md`` files below ``root``, skipping hidden and ignored paths.
+
+    Hidden directories such as ``.obsidian``, ``.trash`` and ``.git`` are
+    pruned without being descended into, as are directories matched by
+    ``ignore`` (paths are matched relative to ``root``).  ``os.scandir``
+    supplies the file type from the directory listing, so no extra
+    ``stat`` is needed per entry.  Symlinks are not followed.
+    """
+    prefix_len = len(os.path.join(str(root), ""))
+    stack = [str(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name.startswith("."):
+                        continue
+                    if ignore is not None and ignore.match_file(_relative(entry.path, prefix_len) + "/"):
+                        continue
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith(".md") and entry.is_file(follow_symlinks=False):
+                    if ignore is not None and ignore.match_file(_relative(entry.path, prefix_len)):
+                        continue
+                    yield entry
+
+
+def _relative(path: str, prefix_len: int) -> str:
+    rel = path[prefix_len:]
+    return rel if os.sep == "/" else rel.replace(os.sep, "/")
+
+
+def iter_note_meta(
+    vaults: Iterable[Path],
+    manifest: Optional[Mapping[str, Tuple[float, int]]] = None,
+    use_ignore_files: bool = True,
+) -> Iterator[NoteMeta]:
+    """Yield a NoteMeta for every Markdown file in the provided vaults.
+
+    Only directory listings and ``stat`` results are used; no file is
+    opened.  Pass each result to :func:`load_note` to read it, e.g. from a
+    thread pool.  The parameters are the same as for :func:`iter_notes`.
+    """
+    for root in vaults:
+        vault_name = root.name
+        # Patterns are compiled once per vault, not per file
+        ignore = _load_ignore_spec(root) if use_ignore_files else None
+        for entry in _iter_markdown_files(root, ignore):
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            path = Path(entry.path)
+            # Manifests are keyed on str(note.path), which drops a leading
+            # "./" that entry.path keeps for a vault given as "." or "./vault"
+            if manifest is not None and manifest.get(str(path)) == (st.st_mtime, st.st_size):
+                continue
+            yield NoteMeta(vault=vault_name, path=path, mtime=st.st_mtime, size=st.st_size)
+
+
+def load_note(meta: NoteMeta) -> Optional[Note]:
+    """Read and parse the note described by ``meta``.
+
+    Returns ``None`` if the file has disappeared or is not valid UTF-8.
+    """
+    try:
+        text = meta.path.read_text(encoding="utf-8")
+    except (UnicodeDecodeError, FileNotFoundError):
+        return None
+    front, body = _parse_front_matter(text)
+    # Normalize to NFC for consistent embeddings
+    body_nfc = _to_nfc(body)
+    title = front.get("title") if isinstance(front.get("title"), str) else meta.path.stem
+    return Note(
+        vault=meta.vault,
+        path=meta.path,
+        title=title,
+        content=body_nfc,
+        front_matter=front,
+        mtime=meta.mtime,
+        size=meta.size,
+    )
+
+
+def iter_notes(
+    vaults: Iterable[Path],
+    manifest: Optional[Mapping[str, Tuple[float, int]]] = None,
+    use_ignore_files: bool = True,
+) -> Iterator[Note]:
     """Yield Note objects for all Markdown files in the provided vaults.
 
     Parameters
@@ -99,32 +287,25 @@ def iter_notes(vaults: Iterable[Path]) -> Iterator[Note]:
     vaults:
         A collection of `Path` objects representing root directories of
         Obsidian vaults.
+    manifest:
+        Optional mapping of file path (as a string) to the ``(mtime, size)``
+        recorded when the note was last indexed, e.g. from
+        :meth:`obskg.vectorstore.FaissVectorStore.manifest`.  Files whose
+        current modification time and size match are skipped without being
+        read.
+    use_ignore_files:
+        Skip paths matched by gitignore-style patterns in the vault's
+        ``.gitignore`` and ``.obsidianignore`` (requires ``pathspec``).
 
     Yields
     ------
     Note
         An object containing the vault name, file path, title and content of
         each Markdown file.  Vault name defaults to the directory name of
-        the root path.
+        the root path.  Files inside hidden directories (``.obsidian``,
+        ``.trash``, ``.git`` ...) are skipped.
     """
-    md_pattern = re.compile(r"\.md$", re.IGNORECASE)
-    for root in vaults:
-        vault_name = root.name
-        for path in root.rglob("*.md"):
-            if not md_pattern.search(path.name):
-                continue
-            try:
-                text = path.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, FileNotFoundError):
-                continue
-            front, body = _parse_front_matter(text)
-            # Normalize to NFC for consistent embeddings
-            body_nfc = unicodedata.normalize("NFC", body)
-            title = front.get("title") if isinstance(front.get("title"), str) else path.stem
-            yield Note(
-                vault=vault_name,
-                path=path,
-                title=title,
-                content=body_nfc,
-                front_matter=front,
-            )
\ No newline at end of file
+    for meta in iter_note_meta(vaults, manifest=manifest, use_ignore_files=use_ignore_files):
+        note = load_note(meta)
+        if note is not None:
+            yield note
@@ -39,11 +39,16 @@ for score, meta in store.search(q_vec, top_k=5):
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import sqlite3
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from .cache import SQLITE_PRAGMAS
 
 try:
     import faiss
@@ -55,6 +60,11 @@ try:
 except ImportError:  # pragma: no cover
     np = None  # type: ignore
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 @dataclass
 class BaseVectorStore:
@@ -70,105 +80,540 @@ class BaseVectorStore:
         raise NotImplementedError
 
 
+INDEX_TYPES = ("flat", "hnsw", "ivfpq")
+# Vector encodings supported by each index type ("pq" for ivfpq is implied)
+QUANTIZATIONS = {
+    "flat": ("none", "fp16", "int8", "pq"),
+    "hnsw": ("none", "fp16"),
+    "ivfpq": ("none", "pq"),
+}
+
+# Base indexes whose search accepts an ``IDSelector``; tombstoned ids are
+# filtered from the results of any other index (e.g. ``IndexPQ``) instead
+_SELECTOR_INDEXES = (faiss.IndexFlat, faiss.IndexScalarQuantizer, faiss.IndexHNSW, faiss.IndexIVF) if faiss else ()
+
+# Per-note columns used for incremental re-indexing
+_MANIFEST_COLUMNS = (("mtime", "REAL"), ("size", "INTEGER"), ("content_hash", "TEXT"))
+
+
 class FaissVectorStore(BaseVectorStore):
-    """FAISS‐backed vector store with metadata persistence in SQLite."""
+    """FAISS‐backed vector store with metadata persistence in SQLite.
+
+    Parameters
+    ----------
+    index_path, meta_path:
+        Where the FAISS index and the SQLite metadata are persisted.
+    dim:
+        Embedding dimensionality; inferred from the first added vector if omitted.
+    index_type:
+        ``"flat"`` (exact search, O(N) per query) suits small vaults.
+        ``"hnsw"`` builds an ``IndexHNSWFlat`` graph with logarithmic query
+        time and is a good default up to ~1M vectors.  ``"ivfpq"`` compresses
+        vectors with product quantization for larger stores; it needs a
+        training set, so vectors are kept in an exact flat index until
+        ``train_size`` of them exist and the index is then rebuilt.
+    quantization:
+        How vectors are stored.  ``"none"`` keeps float32.  ``"fp16"``
+        (flat or HNSW) halves memory with negligible recall loss.  ``"int8"``
+        (flat) quarters it and ``"pq"`` (flat) stores ``pq_m`` bytes per
+        vector; both are trained like ``"ivfpq"``, and PQ typically costs a
+        few percent of recall.  Smaller codes make search, which is
+        memory-bandwidth bound, proportionally faster.
+    hnsw_m, ef_construction, ef_search:
+        HNSW graph degree and build/query beam widths.
+    nlist, pq_m, nprobe:
+        IVF list count, PQ sub-quantizers (must divide ``dim``) and the
+        number of lists probed per query.
+    pre_normalized:
+        Set when every vector passed to ``add_vectors`` and ``search`` is
+        already unit length, to skip ``normalize_L2`` (and the defensive
+        copy it requires).  OpenAI ``text-embedding-3-*`` and Cohere
+        ``embed-v3`` return unit vectors, as does
+        :func:`obskg.embeddings.embed_texts` for local models (it encodes
+        with ``normalize_embeddings=True``).
+    mmap:
+        Memory-map the index file instead of reading it into RAM, so
+        opening a large store is fast and pages are loaded on demand.
+    delta, compact_ratio:
+        With ``delta``, added vectors go to a small exact sidecar index
+        (``<index_path>.delta``) and replaced or removed ids are recorded as
+        tombstones instead of modifying the main index.  ``persist`` then
+        writes only the sidecar until the pending changes exceed
+        ``compact_ratio`` times the size of the main index, when they are
+        merged into it and it is rewritten.  Combined with ``mmap``, an
+        incremental update neither reads nor writes the whole index.
+        Training of ``ivfpq``/``int8``/``pq`` indexes happens on merge.
+    """
 
-    def __init__(self, index_path: str, meta_path: str, dim: Optional[int] = None):
+    def __init__(
+        self,
+        index_path: str,
+        meta_path: str,
+        dim: Optional[int] = None,
+        index_type: str = "flat",
+        hnsw_m: int = 32,
+        ef_construction: int = 200,
+        ef_search: int = 64,
+        nlist: int = 1024,
+        pq_m: int = 16,
+        nprobe: int = 16,
+        train_size: int = 10_000,
+        pre_normalized: bool = False,
+        quantization: str = "none",
+        mmap: bool = False,
+        delta: bool = False,
+        compact_ratio: float = 0.1,
+    ):
         if faiss is None:
             raise RuntimeError("faiss library is required for FaissVectorStore")
         if np is None:
             raise RuntimeError("numpy is required for FaissVectorStore")
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"index_type must be one of {INDEX_TYPES}, got {index_type!r}")
+        if quantization not in QUANTIZATIONS[index_type]:
+            raise ValueError(
+                f"quantization for {index_type!r} must be one of {QUANTIZATIONS[index_type]}, got {quantization!r}"
+            )
         self.index_path = Path(index_path)
         self.meta_path = Path(meta_path)
         self.dim = dim
-        self.index: Optional[faiss.IndexFlatIP] = None
+        self.index_type = index_type
+        self.quantization = quantization
+        self.hnsw_m = hnsw_m
+        self.ef_construction = ef_construction
+        self.ef_search = ef_search
+        self.nlist = nlist
+        self.pq_m = pq_m
+        self.nprobe = nprobe
+        # k-means needs at least nlist points and PQ at least 256 per codebook
+        self.train_size = max(train_size, nlist, 256)
+        self.pre_normalized = pre_normalized
+        self.mmap = mmap
+        self.delta = delta
+        self.compact_ratio = compact_ratio
+        self.delta_path = Path(f"{index_path}.delta")
+        self.index: Optional[faiss.Index] = None
+        # Pending changes to the main index in delta mode: vectors added
+        # since the last merge, and ids whose main-index vector is obsolete
+        self._delta: Optional[faiss.Index] = None
+        self._stale: set = set()
+        self._stale_selector = None
+        self._dirty = False  # main index differs from the file on disk
+        self._compacted = False
         self.conn: Optional[sqlite3.Connection] = None
+        # Serializes index mutation against searches from other threads
+        self._lock = threading.Lock()
         self._load()
 
     def _load(self) -> None:
         # Load or initialize the FAISS index
         if self.index_path.exists():
-            self.index = faiss.read_index(str(self.index_path))
+            self.index = faiss.read_index(str(self.index_path), faiss.IO_FLAG_MMAP if self.mmap else 0)
             self.dim = self.index.d
         elif self.dim is not None:
-            self.index = faiss.IndexFlatIP(self.dim)
+            self.index = self._new_index(self.dim)
+            self._dirty = True
         else:
             # Will be set when the first vector is added
             self.index = None
-        # Setup SQLite for metadata
-        self.conn = sqlite3.connect(str(self.meta_path))
+        # Setup SQLite for metadata.  Autocommit mode skips the sqlite3
+        # module's implicit BEGIN on reads; writes open transactions
+        # explicitly.  The connection may be used from worker threads.
+        self.conn = sqlite3.connect(str(self.meta_path), isolation_level=None, check_same_thread=False)
+        self.conn.executescript(SQLITE_PRAGMAS)
         cur = self.conn.cursor()
         cur.execute(
-            "CREATE TABLE IF NOT EXISTS metadata (id INTEGER PRIMARY KEY, title TEXT, path TEXT, vault TEXT, extra TEXT)"
+            "CREATE TABLE IF NOT EXISTS metadata (id INTEGER PRIMARY KEY, title TEXT, path TEXT, vault TEXT, extra TEXT,"
+            " mtime REAL, size INTEGER, content_hash TEXT)"
         )
-        self.conn.commit()
+        # Databases created before incremental indexing lack the manifest columns
+        columns = {row[1] for row in cur.execute("PRAGMA table_info(metadata)")}
+        for name, decl in _MANIFEST_COLUMNS:
+            if name not in columns:
+                cur.execute(f"ALTER TABLE metadata ADD COLUMN {name} {decl}")
+        if self.index is not None and not isinstance(self.index, faiss.IndexIDMap):
+            self._migrate_positional()
+        cur.execute("CREATE TABLE IF NOT EXISTS stale_ids (id INTEGER PRIMARY KEY)")
+        self._stale = {row[0] for row in cur.execute("SELECT id FROM stale_ids")}
+        if self.delta_path.exists():
+            self._delta = faiss.read_index(str(self.delta_path))
+        self._delta_mode = self.delta
+        if not self._delta_mode and (self._delta is not None or self._stale):
+            # Changes left by a delta-mode store are merged right away
+            self._compact_locked()
+
+    def _migrate_positional(self) -> None:
+        """Convert an index written before id support to an id-mapped one.
+
+        Such indexes identify vectors by position, and their metadata rows
+        use the position as id.  Each vector is re-added under the
+        :func:`path_id` of its note (or its position when the row has no
+        path) and the metadata ids are rewritten to match, so notes can be
+        replaced by id afterwards.  Older stores re-added every note on each
+        run; of duplicate rows for a path only the last one is kept.
+        """
+        n = self.index.ntotal
+        paths = dict(self.conn.execute("SELECT id, path FROM metadata"))
+        new_ids: Dict[int, int] = {}
+        for pos in range(n):
+            path = paths.get(pos)
+            new_ids[path_id(path) if path else pos] = pos
+        positions = np.fromiter(new_ids.values(), dtype=np.int64, count=len(new_ids))
+        base = faiss.clone_index(self.index)
+        base.reset()
+        index = faiss.IndexIDMap2(base)
+        if n:
+            index.add_with_ids(self.index.reconstruct_n(0, n)[positions], np.fromiter(new_ids, dtype=np.int64))
+        self.index = index
+        kept = set(positions.tolist())
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.executemany("DELETE FROM metadata WHERE id=?", [(i,) for i in paths if i not in kept])
+            # Shift rows out of the way first so new ids cannot collide with old ones
+            self.conn.execute("UPDATE metadata SET id = -id - 1")
+            self.conn.executemany(
+                "UPDATE metadata SET id=? WHERE id=?", [(new, -pos - 1) for new, pos in new_ids.items()]
+            )
+        self._dirty = True
+
+    def _delta_index(self) -> "faiss.Index":
+        if self._delta is None:
+            self._delta = faiss.IndexIDMap2(faiss.IndexFlatIP(self.dim))
+        return self._delta
+
+    def _compact_locked(self) -> None:
+        """Merge the delta index and tombstones into the main index."""
+        if self._stale:
+            self.index.remove_ids(faiss.IDSelectorBatch(np.fromiter(self._stale, dtype=np.int64)))
+        if self._delta is not None and self._delta.ntotal:
+            base = faiss.downcast_index(self._delta.index)
+            self.index.add_with_ids(base.reconstruct_n(0, base.ntotal), faiss.vector_to_array(self._delta.id_map))
+            self._maybe_train()
+        self._delta = None
+        self._stale = set()
+        self._stale_selector = None
+        self._dirty = True
+        self._compacted = True
+
+    def _new_index(self, dim: int) -> "faiss.Index":
+        # Explicit ids let vectors be replaced or removed individually
+        return faiss.IndexIDMap2(self._new_base_index(dim))
+
+    def _new_base_index(self, dim: int) -> "faiss.Index":
+        if self.index_type == "hnsw":
+            if self.quantization == "fp16":
+                index = faiss.IndexHNSWSQ(dim, faiss.ScalarQuantizer.QT_fp16, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+            else:
+                index = faiss.IndexHNSWFlat(dim, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = self.ef_construction
+            index.hnsw.efSearch = self.ef_search
+            return index
+        if self.index_type == "flat" and self.quantization == "fp16":
+            return faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT)
+        # Indexes that need training start out flat until there is enough data
+        return faiss.IndexFlatIP(dim)
+
+    def _needs_training(self) -> bool:
+        return self.index_type == "ivfpq" or self.quantization in ("int8", "pq")
 
     def _ensure_index(self, dim: int) -> None:
         if self.index is None:
-            self.index = faiss.IndexFlatIP(dim)
+            self.index = self._new_index(dim)
             self.dim = dim
+            self._dirty = True
 
-    def add_vectors(self, vectors: Iterable[Sequence[float]], metadatas: Iterable[dict]) -> None:
-        vec_list = list(vectors)
+    def _base_index(self) -> "faiss.Index":
+        """Return the index that actually stores vectors, unwrapping the id map."""
+        if isinstance(self.index, faiss.IndexIDMap):
+            return faiss.downcast_index(self.index.index)
+        return self.index
+
+    def _maybe_train(self) -> None:
+        """Rebuild a flat index as a trained one once it holds ``train_size`` vectors.
+
+        Vectors are re-added with their ids, so the metadata rows keyed on
+        them stay valid.
+        """
+        base = self._base_index()
+        if not self._needs_training() or not isinstance(base, faiss.IndexFlat):
+            return
+        if base.ntotal < self.train_size:
+            return
+        data = base.reconstruct_n(0, base.ntotal)
+        d = base.d
+        if self.index_type == "ivfpq":
+            quantizer = faiss.IndexFlatIP(d)
+            index = faiss.IndexIVFPQ(quantizer, d, self.nlist, self.pq_m, 8, faiss.METRIC_INNER_PRODUCT)
+            index.nprobe = self.nprobe
+        elif self.quantization == "int8":
+            index = faiss.IndexScalarQuantizer(d, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT)
+        else:
+            index = faiss.IndexPQ(d, self.pq_m, 8, faiss.METRIC_INNER_PRODUCT)
+        index.train(data)
+        ids = faiss.vector_to_array(self.index.id_map)
+        index = faiss.IndexIDMap2(index)
+        index.add_with_ids(data, ids)
+        self.index = index
+
+    def _search_params(self, ef_search: Optional[int], nprobe: Optional[int], exclude_stale: bool = True):
+        base = self._base_index()
+        kwargs = {}
+        if self._stale and exclude_stale:
+            # Hide main-index vectors that were replaced or removed
+            if self._stale_selector is None:
+                stale = faiss.IDSelectorBatch(np.fromiter(self._stale, dtype=np.int64))
+                self._stale_selector = (stale, faiss.IDSelectorNot(stale))
+            kwargs["sel"] = self._stale_selector[1]
+        if isinstance(base, faiss.IndexHNSW):
+            return faiss.SearchParametersHNSW(efSearch=ef_search or self.ef_search, **kwargs)
+        if isinstance(base, faiss.IndexIVF):
+            return faiss.SearchParametersIVF(nprobe=nprobe or self.nprobe, **kwargs)
+        return faiss.SearchParameters(**kwargs) if kwargs else None
+
+    def add_vectors(
+        self,
+        vectors: Union[np.ndarray, Iterable[Sequence[float]]],
+        metadatas: Iterable[dict],
+        ids: Optional[Sequence[int]] = None,
+    ) -> None:
+        """Add vectors with their metadata.
+
+        ``ids`` are optional non-negative int64 identifiers, e.g. from
+        :func:`path_id`.  Vectors already stored under one of the ids are
+        replaced, which is how a changed note is re-indexed.  Without ids,
+        new sequential ids are assigned.  In delta mode the vectors are
+        added to the delta index.
+        """
         meta_list = list(metadatas)
-        if not vec_list:
+        # Build a C-contiguous float32 (n, dim) matrix in a single pass.
+        # normalize_L2 works in place, so unless the vectors are already
+        # unit length this must be a copy that leaves the caller's data alone.
+        if isinstance(vectors, np.ndarray) and vectors.ndim == 2:
+            if self.pre_normalized:
+                arr = np.ascontiguousarray(vectors, dtype=np.float32)
+            else:
+                arr = np.array(vectors, dtype=np.float32, order="C")
+        else:
+            vec_list = list(vectors)
+            if not vec_list:
+                return
+            arr = np.array(vec_list, dtype=np.float32, order="C")
+        if arr.shape[0] == 0:
             return
-        # Determine dimensionality
-        first_vec = vec_list[0]
-        dim = len(first_vec)
-        self._ensure_index(dim)
-        # Convert to 2D NumPy array of shape (n, dim)
-        arr = np.vstack([np.asarray(v, dtype=np.float32) for v in vec_list])
-        # Normalize vectors for inner product search (convert to unit length)
-        faiss.normalize_L2(arr)
-        # Add to index; track the starting offset for metadata
-        start_id = self.index.ntotal
-        self.index.add(arr)
-        # Insert metadata
-        cur = self.conn.cursor()
-        for i, meta in enumerate(meta_list):
-            cur.execute(
-                "INSERT INTO metadata (id, title, path, vault, extra) VALUES (?, ?, ?, ?, ?)",
-                (start_id + i, meta.get("title"), meta.get("path"), meta.get("vault"), json_dumps(meta.get("extra"))),
-            )
-        self.conn.commit()
+        if not self.pre_normalized:
+            # Normalize vectors for inner product search (convert to unit length)
+            faiss.normalize_L2(arr)
+        with self._lock:
+            self._ensure_index(arr.shape[1])
+            if ids is None:
+                start_id = self.conn.execute("SELECT COALESCE(MAX(id), -1) + 1 FROM metadata").fetchone()[0]
+                id_arr = np.arange(start_id, start_id + arr.shape[0], dtype=np.int64)
+            else:
+                id_arr = np.asarray(ids, dtype=np.int64)
+                self._remove_locked(id_arr.tolist())
+            if self._delta_mode:
+                self._delta_index().add_with_ids(arr, id_arr)
+            else:
+                self.index.add_with_ids(arr, id_arr)
+                self._dirty = True
+            if not self._delta_mode:
+                self._maybe_train()
+            # Insert metadata in one batched statement and transaction
+            rows = [
+                (
+                    int(id_arr[i]),
+                    meta.get("title"),
+                    meta.get("path"),
+                    meta.get("vault"),
+                    json_dumps(meta.get("extra")),
+                    meta.get("mtime"),
+                    meta.get("size"),
+                    meta.get("content_hash"),
+                )
+                for i, meta in enumerate(meta_list)
+            ]
+            with self.conn:
+                self.conn.execute("BEGIN")
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO metadata (id, title, path, vault, extra, mtime, size, content_hash)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
 
-    def search(self, vector: Sequence[float], top_k: int = 5) -> List[Tuple[float, dict]]:
+    def remove(self, ids: Sequence[int]) -> None:
+        """Remove the vectors and metadata stored under ``ids``.
+
+        Unknown ids are ignored.  HNSW graphs cannot delete vectors, so
+        removing from an HNSW store raises ``RuntimeError``.
+        """
+        with self._lock:
+            self._remove_locked([int(i) for i in ids])
+
+    def _existing_ids(self, ids: List[int]) -> List[int]:
+        found: List[int] = []
+        # Stay well below SQLite's bound-parameter limit
+        for i in range(0, len(ids), 500):
+            batch = ids[i:i + 500]
+            placeholders = ",".join("?" * len(batch))
+            found.extend(r[0] for r in self.conn.execute(f"SELECT id FROM metadata WHERE id IN ({placeholders})", batch))
+        return found
+
+    def _remove_locked(self, ids: List[int]) -> None:
+        existing = self._existing_ids(ids) if self.index is not None else []
+        if not existing:
+            return
+        if isinstance(self._base_index(), faiss.IndexHNSW):
+            raise RuntimeError("HNSW indexes do not support removing vectors; rebuild the store instead")
+        selector = faiss.IDSelectorBatch(np.asarray(existing, dtype=np.int64))
+        if self._delta_mode:
+            if self._delta is not None:
+                self._delta.remove_ids(selector)
+            self._stale.update(existing)
+            self._stale_selector = None
+        else:
+            self.index.remove_ids(selector)
+            self._dirty = True
+        with self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.executemany("DELETE FROM metadata WHERE id=?", [(i,) for i in existing])
+            if self._delta_mode:
+                self.conn.executemany("INSERT OR IGNORE INTO stale_ids (id) VALUES (?)", [(i,) for i in existing])
+
+    def search(
+        self,
+        vector: Sequence[float],
+        top_k: int = 5,
+        ef_search: Optional[int] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[float, dict]]:
+        """Return up to ``top_k`` ``(score, metadata)`` pairs, best first.
+
+        ``ef_search`` (HNSW) and ``nprobe`` (IVFPQ) override the store's
+        defaults for this query, trading speed for recall; they are ignored
+        by exact flat indexes.
+        """
         if self.index is None:
             return []
-        arr = np.asarray(vector, dtype=np.float32)[np.newaxis, :]
-        faiss.normalize_L2(arr)
-        distances, indices = self.index.search(arr, top_k)
+        if self.pre_normalized:
+            arr = np.ascontiguousarray(vector, dtype=np.float32)[np.newaxis, :]
+        else:
+            arr = np.array(vector, dtype=np.float32)[np.newaxis, :]
+            faiss.normalize_L2(arr)
+        with self._lock:
+            use_selector = isinstance(self._base_index(), _SELECTOR_INDEXES)
+            post_filter = bool(self._stale) and not use_selector
+            # Over-fetch so that filtering out tombstoned ids still leaves top_k
+            k = top_k + len(self._stale) if post_filter else top_k
+            params = self._search_params(ef_search, nprobe, exclude_stale=use_selector)
+            distances, indices = self.index.search(arr, k, params=params)
+            if post_filter:
+                keep = ~np.isin(indices[0], np.fromiter(self._stale, dtype=np.int64))
+                distances, indices = distances[:, keep][:, :top_k], indices[:, keep][:, :top_k]
+            if self._delta is not None and self._delta.ntotal:
+                # Merge the exact delta results into the main ranking
+                delta_distances, delta_indices = self._delta.search(arr, top_k)
+                distances = np.concatenate([distances, delta_distances], axis=1)
+                indices = np.concatenate([indices, delta_indices], axis=1)
+                order = np.argsort(-distances[0], kind="stable")[:top_k]
+                distances, indices = distances[:, order], indices[:, order]
+        # FAISS pads missing neighbours with -1
+        ids = [int(i) for i in indices[0] if i >= 0]
+        if not ids:
+            return []
+        # Fetch all metadata rows in one query, then restore FAISS ranking order
+        placeholders = ",".join("?" * len(ids))
+        cur = self.conn.execute(
+            f"SELECT id, title, path, vault, extra FROM metadata WHERE id IN ({placeholders})", ids
+        )
+        row_by_id = {row[0]: row[1:] for row in cur.fetchall()}
         results: List[Tuple[float, dict]] = []
-        cur = self.conn.cursor()
         for score, idx in zip(distances[0], indices[0]):
-            cur.execute("SELECT title, path, vault, extra FROM metadata WHERE id=?", (int(idx),))
-            row = cur.fetchone()
+            row = row_by_id.get(int(idx))
             if row:
                 title, path, vault, extra = row
                 results.append((float(score), {"title": title, "path": path, "vault": vault, "extra": json_loads(extra)}))
         return results
 
+    def manifest(self) -> Dict[str, Tuple[float, int]]:
+        """Return ``{path: (mtime, size)}`` for every indexed note.
+
+        Pass the result to :func:`obskg.vault.iter_notes` to skip notes that
+        have not changed since they were indexed.
+        """
+        cur = self.conn.execute("SELECT path, mtime, size FROM metadata WHERE mtime IS NOT NULL")
+        return {path: (mtime, size) for path, mtime, size in cur}
+
+    def update_manifest(self, entries: Iterable[Tuple[str, float, int]]) -> None:
+        """Record new ``(path, mtime, size)`` for notes whose content did not change.
+
+        A touched note keeps its vector, but its manifest row must follow the
+        file, or it is re-read on every run.
+        """
+        rows = [(mtime, size, path) for path, mtime, size in entries]
+        if not rows:
+            return
+        with self._lock, self.conn:
+            self.conn.execute("BEGIN")
+            self.conn.executemany("UPDATE metadata SET mtime=?, size=? WHERE path=?", rows)
+
+    def content_hashes(self) -> Dict[str, str]:
+        """Return ``{path: content_hash}`` for every indexed note."""
+        cur = self.conn.execute("SELECT path, content_hash FROM metadata WHERE content_hash IS NOT NULL")
+        return dict(cur.fetchall())
+
     def persist(self) -> None:
+        """Write the index and close the metadata database.
+
+        The main index file is only rewritten when it changed.  In delta
+        mode, pending changes are merged into it once they exceed
+        ``compact_ratio`` of its size; until then only the delta file is
+        written.
+        """
         if self.index is not None:
-            faiss.write_index(self.index, str(self.index_path))
+            with self._lock:
+                pending = (self._delta.ntotal if self._delta is not None else 0) + len(self._stale)
+                if pending and pending > self.compact_ratio * self.index.ntotal:
+                    self._compact_locked()
+                if self._dirty:
+                    faiss.write_index(self.index, str(self.index_path))
+                    self._dirty = False
+                if self._delta is not None:
+                    faiss.write_index(self._delta, str(self.delta_path))
+                elif self._compacted:
+                    self.delta_path.unlink(missing_ok=True)
+                    self.conn.execute("DELETE FROM stale_ids")
+                    self._compacted = False
         if self.conn is not None:
             self.conn.commit()
             self.conn.close()
 
 
+def path_id(path: str) -> int:
+    """Return a stable, non-negative int64 id for a note path.
+
+    Using the same id every time a note is indexed lets
+    :meth:`FaissVectorStore.add_vectors` replace its previous vector.
+    """
+    digest = hashlib.blake2b(path.encode("utf-8"), digest_size=8).digest()
+    # 62 bits keeps ids clear of FAISS's -1 sentinel and of sequential ids
+    return int.from_bytes(digest, "big") >> 2
+
+
 def json_dumps(obj: Any) -> Optional[str]:  # pragma: no cover
-    import json
     if obj is None:
         return None
+    if orjson is not None:
+        # OPT_NON_STR_KEYS stringifies int keys the way json.dumps does
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
     return json.dumps(obj)
 
 
 def json_loads(s: Optional[str]) -> Any:  # pragma: no cover
-    import json
     if s is None:
         return None
     try:
+        if orjson is not None:
+            return orjson.loads(s)
         return json.loads(s)
     except Exception:
         return None
\ No newline at end of file
@@ -36,26 +36,20 @@ class KnowledgeGraphGenerator:
             preserve any extra fields from the input notes.  Links have
             ``source``, ``target``, ``value`` and ``type``.
         """
-        node_list: List[Dict[str, Any]] = []
-        for note in notes:
-            node = {
+        node_list: List[Dict[str, Any]] = [
+            {
                 "id": note["id"],
                 "label": note.get("label", note["id"]),
                 "group": note.get("group", "default"),
                 "size": note.get("size", 1.0),
                 "color": note.get("color", "#cccccc"),
             }
-            node_list.append(node)
-        link_list: List[Dict[str, Any]] = []
-        for source_id, target_id in connections:
-            link_list.append(
-                {
-                    "source": source_id,
-                    "target": target_id,
-                    "value": 1.0,
-                    "type": "related",
-                }
-            )
+            for note in notes
+        ]
+        link_list: List[Dict[str, Any]] = [
+            {"source": source_id, "target": target_id, "value": 1.0, "type": "related"}
+            for source_id, target_id in connections
+        ]
         return {
             "nodes": node_list,
             "links": link_list,
@@ -21,6 +21,7 @@ dictionary indicating which agent should handle the task (``"ai"``,
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from typing import Dict, List
 
@@ -55,6 +56,13 @@ class HybridTaskRouter:
         "personal_reflection",
     ])
 
+    def __post_init__(self) -> None:
+        # Task lists are snapshotted as frozensets for O(1) membership tests
+        self._ai_tasks = frozenset(self.ai_first_tasks)
+        self._human_tasks = frozenset(self.human_first_tasks)
+        # Per-instance memo of routing decisions
+        self._decide = functools.lru_cache(maxsize=1024)(self._decide)
+
     def route(self, task_type: str, complexity_score: float) -> Dict[str, float]:
         """Determine the handler for a given task.
 
@@ -77,13 +85,19 @@ class HybridTaskRouter:
             ``"collaborative"``.  ``"confidence"`` is a value between 0.0
             and 1.0 reflecting the router’s confidence in its decision.
         """
+        # The decision only depends on which complexity band the score falls
+        # in, so (task_type, band) is an exact and bounded cache key
+        band = -1 if complexity_score < 0.3 else 1 if complexity_score > 0.7 else 0
+        return dict(self._decide(task_type, band))
+
+    def _decide(self, task_type: str, band: int) -> Dict[str, float]:
         handler: str
         confidence: float
         # Determine initial assignment based on task type
-        if task_type in self.ai_first_tasks:
+        if task_type in self._ai_tasks:
             handler = "ai"
             base_confidence = 0.8
-        elif task_type in self.human_first_tasks:
+        elif task_type in self._human_tasks:
             handler = "human"
             base_confidence = 0.8
         else:
@@ -92,7 +106,7 @@ class HybridTaskRouter:
             base_confidence = 0.5
         # Adjust confidence based on complexity
         # Highly complex tasks lean towards human or collaborative routing
-        if complexity_score < 0.3:
+        if band < 0:
             # Simple task: AI confident
             if handler == "ai":
                 confidence = min(1.0, base_confidence + 0.15)
@@ -100,7 +114,7 @@ class HybridTaskRouter:
                 confidence = max(0.0, base_confidence - 0.3)
             else:
                 confidence = base_confidence
-        elif complexity_score > 0.7:
+        elif band > 0:
             # Complex task: human confident
             if handler == "human":
                 confidence = min(1.0, base_confidence + 0.15)
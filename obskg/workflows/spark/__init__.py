@@ -9,13 +9,18 @@ invoked synchronously or asynchronously.
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+import asyncio
+from typing import Any, Dict, Iterator, Optional
 
 from .scanner import SPARKScanner  # noqa: F401
 from .processor import SPARKProcessor  # noqa: F401
 from .analyzer import SPARKAnalyzer  # noqa: F401
 from .refiner import SPARKRefiner  # noqa: F401
 from .producer import SPARKProducer  # noqa: F401
+from .processor import AtomicNote
+
+# Items buffered between two pipeline stages
+_QUEUE_SIZE = 64
 
 
 class SPARKPipeline:
@@ -59,23 +64,71 @@ class SPARKPipeline:
         import time
 
         start = time.time()
+        # Stages run concurrently, connected by bounded queues; ``None``
+        # marks the end of a stream
+        scan_q: "asyncio.Queue[Optional[str]]" = asyncio.Queue(_QUEUE_SIZE)
+        proc_q: "asyncio.Queue[Optional[AtomicNote]]" = asyncio.Queue(_QUEUE_SIZE)
+        num_sources = 0
+        num_atomic_notes = 0
+
         # 1. Scan for new content
-        raw_contents = await self.scanner.scan_async()
-        # 2. Process into atomic notes
-        atomic_notes = []
-        for content in raw_contents:
-            atomic_notes.extend(self.processor.process(content))
-        # 3. Analyze patterns and contradictions
-        analysis_report = self.analyzer.analyze(atomic_notes)
+        async def scan_stage() -> None:
+            for content in await self.scanner.scan_async():
+                await scan_q.put(content)
+            await scan_q.put(None)
+
+        # 2. Process into atomic notes as content arrives; processing is
+        # CPU-bound, so it runs off the event loop
+        async def process_stage() -> None:
+            nonlocal num_sources
+            while (content := await scan_q.get()) is not None:
+                num_sources += 1
+                for note in await asyncio.to_thread(self.processor.process, content):
+                    await proc_q.put(note)
+            await proc_q.put(None)
+
+        # 3. Analyze patterns and contradictions.  The analyzer runs in a
+        # worker thread and pulls notes from the queue as they are emitted,
+        # so only a count is kept rather than every note
+        loop = asyncio.get_running_loop()
+
+        def stream_notes() -> Iterator[AtomicNote]:
+            nonlocal num_atomic_notes
+            while (note := asyncio.run_coroutine_threadsafe(proc_q.get(), loop).result()) is not None:
+                num_atomic_notes += 1
+                yield note
+
+        async def analyze_stage() -> Dict[str, Any]:
+            return await asyncio.to_thread(self.analyzer.analyze, stream_notes())
+
+        stages = [asyncio.ensure_future(scan_stage()), asyncio.ensure_future(process_stage())]
+        analysis = asyncio.ensure_future(analyze_stage())
+        try:
+            await asyncio.gather(*stages, analysis)
+        except BaseException:
+            # A failed stage leaves its neighbours blocked on a queue: cancel
+            # the coroutine stages and end the analyzer thread's note stream
+            # (a thread cannot be cancelled) before propagating the error
+            for task in stages:
+                task.cancel()
+            while not proc_q.empty():
+                proc_q.get_nowait()
+            proc_q.put_nowait(None)
+            await asyncio.gather(*stages, analysis, return_exceptions=True)
+            raise
+        finally:
+            # Pooled connections belong to this event loop
+            await self.scanner.aclose()
+        analysis_report = analysis.result()
         # 4. Refine results (human/AI collaboration)
-        refined_notes = self.refiner.refine(analysis_report)
+        refined_notes = await self.refiner.refine(analysis_report)
         # 5. Produce final notes or summaries
         produced = self.producer.produce(refined_notes, self.vault_path)
         end = time.time()
         return {
             "trigger": trigger,
-            "num_sources": len(raw_contents),
-            "num_atomic_notes": len(atomic_notes),
+            "num_sources": num_sources,
+            "num_atomic_notes": num_atomic_notes,
             "analysis_id": analysis_report.get("analysis_id"),
             "num_produced": len(produced),
             "tti": end - start,
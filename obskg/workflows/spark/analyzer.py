@@ -10,7 +10,7 @@ interface and data structures without performing complex reasoning.
 from __future__ import annotations
 
 import uuid
-from typing import Dict, List, Any
+from typing import Any, Dict, Iterable, List
 
 from .processor import AtomicNote
 
@@ -18,13 +18,15 @@ from .processor import AtomicNote
 class SPARKAnalyzer:
     """Analyse a set of atomic notes to produce an analysis report."""
 
-    def analyze(self, notes: List[AtomicNote]) -> Dict[str, Any]:
+    def analyze(self, notes: Iterable[AtomicNote]) -> Dict[str, Any]:
         """Perform pattern detection, contradiction resolution and graph creation.
 
         Parameters
         ----------
-        notes : list of AtomicNote
-            The atomic notes generated by the processor.
+        notes : iterable of AtomicNote
+            The atomic notes generated by the processor.  They are consumed
+            in a single pass, so a generator works and the notes need not
+            all be held in memory.
 
         Returns
         -------
@@ -36,27 +38,25 @@ class SPARKAnalyzer:
         """
         # Generate a unique ID for this analysis session
         analysis_id = str(uuid.uuid4())
-        # Placeholder pattern detection: group notes by their first tag
-        patterns = {}
-        for note in notes:
-            key = note.tags[0] if note.tags else "misc"
-            patterns.setdefault(key, 0)
-            patterns[key] += 1
-        pattern_list = [{"pattern": k, "count": v} for k, v in patterns.items()]
-        # Placeholder contradictions: none detected
-        contradictions: List[Dict[str, Any]] = []
-        # Graph: one node per note, no edges
+        # Placeholder pattern detection: group notes by their first tag.
+        # Graph: one node per note, no edges.  Both are built in one pass.
+        patterns: Dict[str, int] = {}
         nodes = []
         for idx, note in enumerate(notes):
+            key = note.tags[0] if note.tags else "misc"
+            patterns[key] = patterns.get(key, 0) + 1
             nodes.append(
                 {
                     "id": f"node-{idx}",
                     "label": note.tags[0] if note.tags else f"note-{idx}",
-                    "group": note.tags[0] if note.tags else "misc",
+                    "group": key,
                     "size": 1.0,
                     "color": "#8888cc",
                 }
             )
+        pattern_list = [{"pattern": k, "count": v} for k, v in patterns.items()]
+        # Placeholder contradictions: none detected
+        contradictions: List[Dict[str, Any]] = []
         graph = {"nodes": nodes, "links": []}
         return {
             "analysis_id": analysis_id,
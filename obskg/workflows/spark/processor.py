@@ -13,9 +13,47 @@ machine learning libraries to perform summarisation and tagging.
 
 from __future__ import annotations
 
+import functools
+import re
 from dataclasses import dataclass
 from typing import Iterable, List, Dict
 
+# A whitespace-delimited word of five or more letters, optionally wrapped in
+# punctuation; equivalent to ``w.strip(".,;:!?()")`` followed by the
+# ``len(t) > 4 and t.isalpha()`` test, in one pass over the text
+_TAG_TOKEN = re.compile(r"(?<!\S)[.,;:!?()]*([^\W\d_]{5,})[.,;:!?()]*(?!\S)")
+_find_tag_tokens = _TAG_TOKEN.finditer
+
+# Tags kept per paragraph by ``process`` and per note by ``auto_tag``
+_MAX_TAGS_PROCESS = 3
+_MAX_TAGS_AUTO_TAG = 5
+
+
+def _extract_tags(text: str, k: int) -> List[str]:
+    """Return the first ``k`` unique candidate tags of ``text``, lowercased.
+
+    Matching stops as soon as ``k`` distinct tags are found, so only the
+    start of a long paragraph is tokenized.
+    """
+    if k <= 0:
+        return []
+    tags: Dict[str, None] = {}
+    for match in _find_tag_tokens(text):
+        tags[match.group(1).lower()] = None
+        if len(tags) == k:
+            break
+    return list(tags)
+
+
+@functools.lru_cache(maxsize=8192)
+def _tags_for(content: str, k: int = _MAX_TAGS_AUTO_TAG) -> tuple:
+    """Return the first ``k`` unique candidate tags of ``content``.
+
+    Memoized on the text itself because ``AtomicNote`` is a mutable
+    dataclass and cannot be used as a cache key.
+    """
+    return tuple(_extract_tags(content, k))
+
 
 @dataclass
 class AtomicNote:
@@ -61,24 +99,22 @@ class SPARKProcessor:
         """
         if not raw_content:
             return []
-        # Naïve split into paragraphs as atomic notes
-        paragraphs = [p.strip() for p in raw_content.split("\n\n") if p.strip()]
         notes: List[AtomicNote] = []
-        for para in paragraphs:
-            # Truncate to first 150 words as a summary
-            words = para.split()
-            summary = " ".join(words[:150])
-            # Simple auto‑tagging: take top 3 unique words >4 characters
-            tokens = [w.strip(".,;:!?()").lower() for w in words]
-            # Filter tokens by length and alphabetic
-            candidates = [t for t in tokens if len(t) > 4 and t.isalpha()]
-            unique_candidates = []
-            for tok in candidates:
-                if tok not in unique_candidates:
-                    unique_candidates.append(tok)
-                if len(unique_candidates) >= 3:
-                    break
-            tags = unique_candidates
+        # Naïve split into paragraphs as atomic notes, walking the blank-line
+        # separators in place rather than materializing every piece up front
+        n = len(raw_content)
+        pos = 0
+        while pos < n:
+            sep = raw_content.find("\n\n", pos)
+            end = n if sep < 0 else sep
+            para = raw_content[pos:end].strip()
+            pos = end + 2
+            if not para:
+                continue
+            # Truncate to first 150 words as a summary; splitting stops there
+            summary = " ".join(para.split(None, 150)[:150])
+            # Simple auto‑tagging: take the first 3 unique words >4 characters
+            tags = _extract_tags(para, _MAX_TAGS_PROCESS)
             # For connections, we leave empty; to be filled by analyzer
             notes.append(AtomicNote(content=summary, tags=tags, connections=[]))
         return notes
@@ -96,13 +132,4 @@ class SPARKProcessor:
         list of str
             A list of tag strings with no duplicates.
         """
-        words = note.content.split()
-        tokens = [w.strip(".,;:!?()").lower() for w in words]
-        candidates = [t for t in tokens if len(t) > 4 and t.isalpha()]
-        tags: List[str] = []
-        for tok in candidates:
-            if tok not in tags:
-                tags.append(tok)
-            if len(tags) >= 5:
-                break
-        return tags
\ No newline at end of file
+        return list(_tags_for(note.content))
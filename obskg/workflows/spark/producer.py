@@ -6,22 +6,87 @@ export) from the refined analysis.  The produced notes are saved to the
 specified vault path or returned to the caller.
 
 In this simplified implementation, the producer writes each refined
-report as a JSON file to the vault directory.
+report as a JSON file to the vault directory, or all of them as lines of
+a single JSONL file.
 """
 
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# File receiving all reports when ``produce`` is called with ``aggregate=True``
+AGGREGATE_FILENAME = "spark_reports.jsonl"
+
+# Flags for writing a whole report file in one go (O_BINARY only exists on Windows)
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+# Flags for adding lines to the aggregate file, keeping earlier runs' reports
+_APPEND_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0)
+
+
+def _serialize(report: Dict[str, Any]) -> bytes:
+    """Encode a report as indented UTF-8 JSON (with orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(report, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def _serialize_line(report: Dict[str, Any]) -> bytes:
+    """Encode a report as one compact line of UTF-8 JSON, newline included."""
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(report, ensure_ascii=False).encode("utf-8") + b"\n"
+
+
+def _write_file(path: Path, data: bytes, flags: int = _WRITE_FLAGS) -> Optional[Path]:
+    """Write ``data`` with raw ``open``/``write``/``close`` system calls."""
+    try:
+        fd = os.open(path, flags, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+    except OSError:
+        return None
+    return path
 
 
 class SPARKProducer:
-    """Produce final artefacts from refined analysis."""
+    """Produce final artefacts from refined analysis.
+
+    Parameters
+    ----------
+    max_workers : int
+        Number of threads used to write report files concurrently.
+    """
 
-    def produce(self, refined_reports: Iterable[Dict[str, Any]], vault_path: str) -> List[Path]:
+    def __init__(self, max_workers: int = 8) -> None:
+        self.max_workers = max_workers
+
+    def produce(
+        self, refined_reports: Iterable[Dict[str, Any]], vault_path: str, aggregate: bool = False
+    ) -> List[Path]:
         """Write refined reports into the vault as JSON files.
 
+        All reports are serialized up front and the resulting buffers are
+        then written as one batch, each with a single unbuffered ``write``,
+        on a small thread pool so the kernel calls overlap.  A report that
+        cannot be serialized or written is skipped.  With ``aggregate``,
+        the reports are instead appended as lines to one
+        ``spark_reports.jsonl`` file, which replaces one file creation per
+        report with a single one for large runs.  Like the per-report
+        files, reports from earlier runs are kept.
+
         Parameters
         ----------
         refined_reports : Iterable[dict]
@@ -30,6 +95,10 @@ class SPARKProducer:
             Filesystem path to the target Obsidian vault.  If the
             directory does not exist it will be created.
 
+        aggregate : bool
+            Append to a single JSONL file instead of writing one JSON file
+            per report.
+
         Returns
         -------
         list of pathlib.Path
@@ -37,14 +106,29 @@ class SPARKProducer:
         """
         vault = Path(vault_path)
         vault.mkdir(parents=True, exist_ok=True)
-        written: List[Path] = []
+        if aggregate:
+            lines: List[bytes] = []
+            for report in refined_reports:
+                try:
+                    lines.append(_serialize_line(report))
+                except Exception:
+                    continue
+            if not lines:
+                return []
+            written = _write_file(vault / AGGREGATE_FILENAME, b"".join(lines), _APPEND_FLAGS)
+            return [written] if written is not None else []
+        batch: List[Tuple[Path, bytes]] = []
         for report in refined_reports:
             analysis_id = report.get("analysis_id", "unknown")
             out_file = vault / f"spark_report_{analysis_id}.json"
             try:
-                with out_file.open("w", encoding="utf-8") as f:
-                    json.dump(report, f, ensure_ascii=False, indent=2)
-                written.append(out_file)
+                data = _serialize(report)
             except Exception:
                 continue
-        return written
\ No newline at end of file
+            batch.append((out_file, data))
+        if len(batch) <= 1 or self.max_workers <= 1:
+            results = [_write_file(path, data) for path, data in batch]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batch))) as executor:
+                results = list(executor.map(lambda item: _write_file(*item), batch))
+        return [path for path in results if path is not None]
@@ -5,31 +5,51 @@ producing polished notes or recommendations.  It may solicit
 human feedback, apply edits and filter out unhelpful content.
 
 The implementation here simply passes through the analysis report and
-wraps it in a list for consistency with later phases.
+wraps it in a list for consistency with later phases.  Refinement is
+asynchronous so that per-report LLM calls can run concurrently.
 """
 
 from __future__ import annotations
 
-from typing import List, Dict, Any
+import asyncio
+from typing import Any, Dict, Iterable, List, Union
 
 
 class SPARKRefiner:
     """Refine the analysis report into actionable items."""
 
-    def refine(self, analysis_report: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def refine(
+        self,
+        analysis_report: Union[Dict[str, Any], Iterable[Dict[str, Any]]],
+        concurrency: int = 8,
+    ) -> List[Dict[str, Any]]:
         """Refine the analysis.
 
         Parameters
         ----------
-        analysis_report : dict
-            Output from the analyzer containing patterns and graph data.
+        analysis_report : dict or iterable of dict
+            Output from the analyzer containing patterns and graph data, or
+            several such reports.
+        concurrency : int
+            Maximum number of reports refined at the same time.
 
         Returns
         -------
         list of dict
-            A list of refined notes.  In this skeleton, the list contains
-            only the analysis report itself.  In a real system, this
-            method would solicit human feedback or run additional LLM
-            summarisation.
+            A list of refined notes, one per report and in input order.  In
+            this skeleton each report is passed through unchanged.  In a
+            real system, each would be refined by soliciting human feedback
+            or running additional LLM summarisation.
         """
-        return [analysis_report]
\ No newline at end of file
+        reports = [analysis_report] if isinstance(analysis_report, dict) else list(analysis_report)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def refine_one(report: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._refine_one(report)
+
+        return list(await asyncio.gather(*(refine_one(report) for report in reports)))
+
+    async def _refine_one(self, report: Dict[str, Any]) -> Dict[str, Any]:
+        """Refine a single report (placeholder for an LLM call)."""
+        return report
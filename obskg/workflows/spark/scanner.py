@@ -15,8 +15,18 @@ rather than fully functional web scraping or transcription.
 from __future__ import annotations
 
 import asyncio
+import logging
+import urllib.request
 from typing import Any, Dict, Iterable, List, Optional
 
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+
+logger = logging.getLogger(__name__)
+
 
 class SPARKScanner:
     """Collect raw materials for the SPARK workflow.
@@ -27,6 +37,13 @@ class SPARKScanner:
         Configuration dictionary specifying the sources (e.g. RSS feed
         URLs, API keys) and thresholds.  The scanner is designed to be
         asynchronous so that multiple sources can be fetched in parallel.
+        ``max_connections`` and ``max_connections_per_host`` bound the
+        HTTP connection pool (64 and 8 by default).
+
+    The HTTP session is created on first use and reused by later scans;
+    call :meth:`aclose` when done with the scanner.  Without the optional
+    ``aiohttp`` package, sources are fetched with ``urllib`` on worker
+    threads instead.
     """
 
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
@@ -35,30 +52,81 @@ class SPARKScanner:
         # Placeholder attributes for external integrations
         self.transcriber = None  # Should be set to an instance of a transcriber
         self.filter_threshold: float = self.config.get("relevance_threshold", 0.7)
+        self._session: Optional["aiohttp.ClientSession"] = None
 
     def scan(self) -> List[str]:
         """Synchronously fetch content from sources.
 
+        This runs :meth:`scan_async` in a new event loop, so it must not be
+        called from a running loop (await ``scan_async`` there instead).
+
         Returns
         -------
         list of str
             A list of raw content strings (e.g. article text, transcripts).
         """
-        # In a real implementation this would fetch from RSS feeds,
-        # perform web scraping, call audio transcription APIs, etc.  Here
-        # we return empty content to demonstrate the interface.
-        return []
+        async def scan_once() -> List[str]:
+            try:
+                return await self.scan_async()
+            finally:
+                # The session is bound to this short-lived event loop
+                await self.aclose()
+
+        return asyncio.run(scan_once())
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Return the shared HTTP session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.config.get("max_connections", 64),
+                limit_per_host=self.config.get("max_connections_per_host", 8),
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the HTTP session and its pooled connections, if open."""
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+    async def _fetch_one(self, session: "aiohttp.ClientSession", source: str) -> str:
+        """Fetch a single source and return its body as text."""
+        async with session.get(source) as response:
+            response.raise_for_status()
+            return await response.text()
+
+    def _fetch_blocking(self, source: str) -> str:
+        """Fetch a single source with ``urllib`` (used when aiohttp is missing)."""
+        with urllib.request.urlopen(source, timeout=self.config.get("timeout", 30)) as response:
+            charset = response.headers.get_content_charset() or "utf-8"
+            return response.read().decode(charset, errors="replace")
 
     async def scan_async(self) -> List[str]:
         """Asynchronously fetch content from sources.
 
+        One request is issued per source and all of them are awaited
+        together over pooled connections, so network-bound fetches overlap
+        instead of running one after another.  Sources that fail are logged and left out.
+
         Returns
         -------
         list of str
-            A list of raw content strings.  This method can be awaited
-            within an asynchronous pipeline.
+            A list of raw content strings, in source order.  This method
+            can be awaited within an asynchronous pipeline.
         """
-        # Example asynchronous placeholder; a real implementation would
-        # gather from network concurrently.
-        await asyncio.sleep(0.0)
-        return self.scan()
\ No newline at end of file
+        if not self.sources:
+            return []
+        if aiohttp is None:
+            fetches = [asyncio.to_thread(self._fetch_blocking, source) for source in self.sources]
+        else:
+            session = self._get_session()
+            fetches = [self._fetch_one(session, source) for source in self.sources]
+        results = await asyncio.gather(*fetches, return_exceptions=True)
+        contents: List[str] = []
+        for source, result in zip(self.sources, results):
+            if isinstance(result, str):
+                contents.append(result)
+            else:
+                logger.warning("Failed to fetch %s: %s", source, result)
+        return contents
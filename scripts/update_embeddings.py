@@ -12,21 +12,30 @@ Usage:
         --index index.faiss --meta meta.sqlite3 --openai-key $OPENAI_API_KEY
 
 When the script runs for the first time it builds a new FAISS index and
-metadata database.  Subsequent runs will append new notes or update
-modified ones by re‑embedding them.  A simple SHA256 of the note content
-serves as a fingerprint for caching.  If the cached embedding exists and
-the file has not changed, the cached vector is reused and no API call is
-made, saving cost.
+metadata database.  Subsequent runs only look at notes whose modification
+time or size differs from the manifest stored in the metadata database;
+unchanged notes are not even read.  A changed note whose content hash
+matches the indexed one (e.g. it was merely touched) is skipped too; only
+its manifest entry is refreshed.
+Vectors are keyed by a hash of the note path, so a modified note replaces
+its previous vector and deleted notes are removed from the index.  The
+embedding cache is keyed by the model name and a BLAKE3 hash of the note
+content (SHA256 when the ``blake3`` package is missing; a cache keeps the
+algorithm it was created with), so identical text
+is never embedded twice: moved, renamed or duplicated notes reuse the cached
+vector and no API call is made, saving cost.  Cache entries whose content
+only belonged to deleted notes are dropped.
 """
 import argparse
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from obskg.vault import iter_notes
+from obskg.vault import iter_note_meta, load_note
 from obskg.embeddings import EmbeddingConfig, embed_texts
-from obskg.vectorstore import FaissVectorStore
-from obskg.cache import EmbeddingCache
+from obskg.vectorstore import FaissVectorStore, path_id
+from obskg.cache import EmbeddingCache, hash_text
 
 
 def main(argv: list[str] | None = None) -> int:
@@ -37,47 +46,85 @@ def main(argv: list[str] | None = None) -> int:
     parser.add_argument("--cache", default="embeddings.sqlite3", help="Path to the embedding cache database")
     parser.add_argument("--openai-key", required=True, help="OpenAI API key for generating embeddings")
     parser.add_argument("--model", default="text-embedding-3-small", help="Embedding model name")
+    parser.add_argument(
+        "--cache-dtype",
+        default="float32",
+        choices=["float32", "float16"],
+        help="Precision of vectors stored in the embedding cache (float16 halves its size but is lossy)",
+    )
+    parser.add_argument("--workers", type=int, default=32, help="Threads used to hash notes and probe the cache")
     args = parser.parse_args(argv)
 
     vault_paths = [Path(v).expanduser() for v in args.vault]
-    store = FaissVectorStore(index_path=args.index, meta_path=args.meta)
-    cache = EmbeddingCache(path=Path(args.cache), ttl=None)
-    texts = []
+    # OpenAI embeddings are unit length, so the store can skip normalize_L2.
+    # The index is memory-mapped and changes go to a small delta file, so an
+    # incremental run does not load or rewrite the whole index.
+    store = FaissVectorStore(
+        index_path=args.index, meta_path=args.meta, pre_normalized=True, mmap=True, delta=True
+    )
+    cache = EmbeddingCache(path=Path(args.cache), ttl=None, readers=min(args.workers, 8), dtype=args.cache_dtype)
+    indexed_hashes = store.content_hashes()
+    manifest = store.manifest()
+    # Drop vectors of notes deleted since the last run
+    deleted = [path for path in manifest if not os.path.exists(path)]
+    store.remove([path_id(path) for path in deleted])
+    touched = []  # (path, mtime, size) of notes whose content is unchanged
     metas = []
-    for note in iter_notes(vault_paths):
-        # Use note path + modification time as a fingerprint to decide if we need to re‑embed
-        mtime = note.path.stat().st_mtime
-        fingerprint = f"{note.path}:{mtime}"
-        cached_vec = cache.get(fingerprint)
-        if cached_vec is not None:
-            texts.append(cached_vec)
-        else:
-            texts.append(note.content)
-        metas.append({"title": note.title, "path": str(note.path), "vault": note.vault})
+    vectors = []  # cached vector, or None until embedded below
+    pending = {}  # fingerprint -> (text, positions of notes with that content)
 
-    # Separate cached vectors and raw text
-    ready_vectors = []  # vectors that are already cached
-    to_embed = []  # text that needs embedding
-    embed_indices = []  # positions of texts to embed
-    for i, item in enumerate(texts):
-        if isinstance(item, list) or hasattr(item, "__array__"):
-            ready_vectors.append(item)
-        else:
-            to_embed.append(item)
-            embed_indices.append(i)
-    # Generate embeddings for new items
-    if to_embed:
-        vectors = embed_texts(to_embed, EmbeddingConfig(provider="openai", model=args.model, api_key=args.openai_key))
-        # Insert into ready_vectors at appropriate positions
-        for idx, vec in zip(embed_indices, vectors):
-            ready_vectors.insert(idx, vec)
-            # Cache the embedding keyed by path:mtime
-            mtime = Path(metas[idx]["path"]).stat().st_mtime
-            fingerprint = f"{metas[idx]['path']}:{mtime}"
+    def probe(meta):
+        note = load_note(meta)
+        if note is None:
+            return None
+        content_hash = hash_text(note.content, cache.hash_algorithm)
+        if indexed_hashes.get(str(note.path)) == content_hash:
+            return note, content_hash, None, None  # Touched but not modified
+        # Content-addressed: a moved or renamed note still hits the cache
+        fingerprint = f"{args.model}:{content_hash}"
+        return note, content_hash, fingerprint, cache.get(fingerprint)
+
+    # The scan only stats files; reading, hashing and cache lookups release
+    # the GIL, so they run in the pool.  Results come back in scan order
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        notes = iter_note_meta(vault_paths, manifest=manifest)
+        probes = [p for p in executor.map(probe, notes) if p is not None]
+    for note, content_hash, fingerprint, cached_vec in probes:
+        if fingerprint is None:
+            touched.append((str(note.path), note.mtime, note.size))
+            continue
+        if cached_vec is None:
+            pending.setdefault(fingerprint, (note.content, []))[1].append(len(metas))
+        vectors.append(cached_vec)
+        metas.append(
+            {
+                "title": note.title,
+                "path": str(note.path),
+                "vault": note.vault,
+                "mtime": note.mtime,
+                "size": note.size,
+                "content_hash": content_hash,
+            }
+        )
+
+    # Embed every distinct cache miss in one batched call and scatter the
+    # results back to all notes sharing that content
+    if pending:
+        texts = [text for text, _ in pending.values()]
+        embedded = embed_texts(texts, EmbeddingConfig(provider="openai", model=args.model, api_key=args.openai_key))
+        for (fingerprint, (_, positions)), vec in zip(pending.items(), embedded):
+            for idx in positions:
+                vectors[idx] = vec
             cache.set(fingerprint, vec)
-    # Add to vector store and persist
-    store.add_vectors(ready_vectors, metas)
+    store.update_manifest(touched)
+    # Add to vector store (replacing previous vectors of modified notes) and persist
+    store.add_vectors(vectors, metas, ids=[path_id(meta["path"]) for meta in metas])
+    # The store's path -> content hash table tells which cached content is
+    # still in use; entries only deleted notes had are garbage
+    live = set(store.content_hashes().values())
     store.persist()
+    stale = {indexed_hashes[path] for path in deleted if path in indexed_hashes} - live
+    cache.delete([f"{args.model}:{content_hash}" for content_hash in stale])
     return 0
 
 
@@ -0,0 +1,150 @@
+"""Tests for the SQLite-backed caches in ``obskg.cache``."""
+
+from pathlib import Path
+
+import numpy as np
+
+from obskg import cache as cache_mod
+from obskg.cache import EmbeddingCache, ResponseCache, SemanticResponseCache
+
+
+def test_embedding_cache_roundtrip(tmp_path: Path) -> None:
+    cache = EmbeddingCache(path=tmp_path / "emb.sqlite3")
+    assert cache.get("hello") is None
+    cache.set("hello", [0.1, 0.2, 0.3])
+    assert np.allclose(cache.get("hello"), [0.1, 0.2, 0.3])
+
+
+def test_embedding_cache_delete(tmp_path: Path) -> None:
+    cache = EmbeddingCache(path=tmp_path / "emb.sqlite3")
+    cache.set("a", [1.0])
+    cache.set("b", [2.0])
+    cache.delete(["a", "missing"])
+    assert cache.get("a") is None
+    assert np.allclose(cache.get("b"), [2.0])
+
+
+def test_response_cache_ttl(tmp_path: Path) -> None:
+    cache = ResponseCache(path=tmp_path / "resp.sqlite3", ttl=-1)
+    cache.set("prompt", "answer")
+    assert cache.get("prompt") is None
+
+
+def test_semantic_cache_hit_and_miss(tmp_path: Path) -> None:
+    cache = SemanticResponseCache(path=tmp_path / "sem.sqlite3", threshold=0.9)
+    assert cache.get([1.0, 0.0, 0.0]) is None
+    cache.set([1.0, 0.0, 0.0], "x-axis")
+    cache.set([0.0, 1.0, 0.0], "y-axis")
+    assert cache.get([2.0, 0.1, 0.0]) == "x-axis"
+    assert cache.get([0.0, 3.0, 0.0]) == "y-axis"
+    assert cache.get([1.0, 1.0, 1.0]) is None
+
+
+def test_semantic_cache_reload_from_disk(tmp_path: Path) -> None:
+    path = tmp_path / "sem.sqlite3"
+    SemanticResponseCache(path=path).warm_up([([0.0, 0.0, 1.0], "z-axis"), ([1.0, 0.0, 0.0], "x-axis")])
+    cache = SemanticResponseCache(path=path)
+    assert cache.get([0.0, 0.0, 5.0]) == "z-axis"
+
+
+def test_semantic_cache_numpy_fallback(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(cache_mod, "faiss", None)
+    cache = SemanticResponseCache(path=tmp_path / "sem.sqlite3", threshold=0.9)
+    cache.set([1.0, 0.0], "x")
+    cache.set([0.0, 1.0], "y")
+    assert cache.get([0.1, 1.0]) == "y"
+    assert cache.get([1.0, -1.0]) is None
+
+
+def test_embedding_cache_discards_pickled_vectors(tmp_path: Path) -> None:
+    import pickle
+    import sqlite3
+
+    path = tmp_path / "emb.sqlite3"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE embeddings (key TEXT PRIMARY KEY, value BLOB, timestamp REAL)")
+    conn.execute(
+        "INSERT INTO embeddings VALUES (?, ?, ?)",
+        (cache_mod.hash_text("legacy"), pickle.dumps([1.0, 2.0]), 0.0),
+    )
+    conn.commit()
+    conn.close()
+    cache = EmbeddingCache(path=path)
+    assert cache.get("legacy") is None
+    cache.set("legacy", [1.0, 2.0])
+    assert np.allclose(cache.get("legacy"), [1.0, 2.0])
+
+
+def test_cache_keeps_recorded_hash_algorithm(tmp_path: Path, monkeypatch) -> None:
+    import sqlite3
+
+    # Rows written before the algorithm was recorded were keyed with SHA-256
+    path = tmp_path / "resp.sqlite3"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE responses (key TEXT PRIMARY KEY, value TEXT, timestamp REAL)")
+    conn.execute("INSERT INTO responses VALUES (?, ?, ?)", (cache_mod.hash_text("q", "sha256"), "a", 0.0))
+    conn.commit()
+    conn.close()
+    assert ResponseCache(path=path).get("q") == "a"
+
+    # A new database keeps its algorithm when another process defaults to a different one
+    monkeypatch.setattr(cache_mod, "DEFAULT_HASH_ALGORITHM", "sha256")
+    cache = EmbeddingCache(path=tmp_path / "emb.sqlite3")
+    cache.set("x", [1.0])
+    monkeypatch.setattr(cache_mod, "DEFAULT_HASH_ALGORITHM", "blake3")
+    other = EmbeddingCache(path=tmp_path / "emb.sqlite3")
+    assert other.hash_algorithm == "sha256"
+    assert np.allclose(other.get("x"), [1.0])
+
+
+def test_semantic_cache_sees_writes_from_other_connections(tmp_path: Path) -> None:
+    path = tmp_path / "sem.sqlite3"
+    reader = SemanticResponseCache(path=path)
+    writer = SemanticResponseCache(path=path)
+    reader.set([1.0, 0.0], "x")
+    assert reader.get([0.0, 1.0]) is None
+    writer.set([0.0, 1.0], "y")
+    assert reader.get([0.0, 1.0]) == "y"
+
+
+def test_semantic_cache_warm_up_extends_loaded_index(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(cache_mod, "_WARM_UP_BATCH", 2)
+    cache = SemanticResponseCache(path=tmp_path / "sem.sqlite3", threshold=0.99)
+    cache.set([1.0, 0.0, 0.0], "first")
+    assert cache.get([1.0, 0.0, 0.0]) == "first"
+    cache.warm_up([([0.0, 1.0, 0.0], "y"), ([0.0, 0.0, 1.0], "z"), ([1.0, 1.0, 0.0], "xy")])
+    assert cache.get([0.0, 0.0, 1.0]) == "z"
+    assert cache.get([2.0, 2.0, 0.0]) == "xy"
+    assert cache._ids == sorted(cache._ids)
+
+
+def test_embedding_cache_concurrent_access(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    cache = EmbeddingCache(path=tmp_path / "emb.sqlite3", readers=2)
+
+    def roundtrip(i: int) -> bool:
+        cache.set(f"text-{i}", [float(i), 1.0])
+        return np.allclose(cache.get(f"text-{i}"), [float(i), 1.0])
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert all(executor.map(roundtrip, range(64)))
+
+
+def test_embedding_cache_float16_storage(tmp_path: Path) -> None:
+    import sqlite3
+
+    path = tmp_path / "emb.sqlite3"
+    vec = np.random.default_rng(0).standard_normal(1536).astype(np.float32)
+    EmbeddingCache(path=path).set("full", vec)
+    half = EmbeddingCache(path=path, dtype="float16")
+    half.set("half", vec)
+    conn = sqlite3.connect(str(path))
+    sizes = dict(conn.execute("SELECT dtype, length(value) FROM embeddings"))
+    conn.close()
+    assert sizes == {"float32": 1536 * 4, "float16": 1536 * 2}
+    # Entries of either precision are read back as float32
+    assert np.array_equal(half.get("full"), vec)
+    restored = half.get("half")
+    assert restored.dtype == np.float32
+    assert np.allclose(restored, vec, rtol=1e-3, atol=1e-4)
@@ -0,0 +1,35 @@
+"""Tests for ``obskg.optimization.cost_optimizer.CostOptimizer``."""
+
+from obskg.optimization.cost_optimizer import CostOptimizer
+
+
+def test_batch_operations_groups_mixed_operations_by_model() -> None:
+    ops = [
+        {"id": 1, "model": "gpt-4", "complexity": 0.2},
+        {"id": 2, "complexity": 1},  # default model, integer complexity
+        {"id": 3, "model": "gpt-4", "complexity": 0.9},
+        {"id": 4, "model": "claude-opus"},  # no complexity
+        {"id": 5, "model": "gpt-3.5-turbo", "complexity": 0.5},
+    ]
+    batches = CostOptimizer().batch_operations(ops)
+    assert [[op["id"] for op in batch] for batch in batches] == [[4], [2, 5], [3, 1]]
+
+
+def test_batch_operations_splits_at_token_budget() -> None:
+    ops = [{"id": i, "model": "gpt-4", "complexity": 1.0 - i / 10, "token_estimate": 40} for i in range(5)]
+    batches = CostOptimizer().batch_operations(ops, max_batch_tokens=100)
+    assert [[op["id"] for op in batch] for batch in batches] == [[0, 1], [2, 3], [4]]
+    # A batch may reach the budget exactly
+    batches = CostOptimizer().batch_operations(ops[:4], max_batch_tokens=80)
+    assert [len(batch) for batch in batches] == [2, 2]
+
+
+def test_batch_operations_isolates_operation_over_budget() -> None:
+    ops = [
+        {"id": "small", "complexity": 0.9, "token_estimate": 10},
+        {"id": "huge", "complexity": 0.5, "token_estimate": 500},
+        {"id": "tail", "complexity": 0.1, "token_estimate": 10},
+    ]
+    batches = CostOptimizer().batch_operations(ops, max_batch_tokens=100)
+    assert [[op["id"] for op in batch] for batch in batches] == [["small"], ["huge"], ["tail"]]
+    assert CostOptimizer().batch_operations([]) == []
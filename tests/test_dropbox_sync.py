@@ -0,0 +1,113 @@
+"""Tests for ``obskg.integrations.dropbox_sync``."""
+
+import hashlib
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+dropbox = pytest.importorskip("dropbox")
+
+from obskg.integrations import dropbox_sync
+from obskg.integrations.dropbox_sync import DROPBOX_HASH_BLOCK_SIZE, HashCache, VaultSyncManager
+
+
+def _reference_hash(data: bytes) -> str:
+    # Dropbox's published content_hash algorithm, block by block
+    blocks = [data[i:i + DROPBOX_HASH_BLOCK_SIZE] for i in range(0, len(data), DROPBOX_HASH_BLOCK_SIZE)]
+    return hashlib.sha256(b"".join(hashlib.sha256(b).digest() for b in blocks)).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "size", [0, 5, DROPBOX_HASH_BLOCK_SIZE, DROPBOX_HASH_BLOCK_SIZE + 1, 2 * DROPBOX_HASH_BLOCK_SIZE + 7]
+)
+def test_file_hash_matches_dropbox_content_hash(tmp_path: Path, size: int) -> None:
+    data = (b"obskg" * (size // 5 + 1))[:size]
+    path = tmp_path / "f.bin"
+    path.write_bytes(data)
+    digest = VaultSyncManager("token")._file_hash(path)
+    assert digest == _reference_hash(data)
+    if size == 0:
+        # An empty file hashes the empty concatenation of block digests
+        assert digest == "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+
+
+def _make_vault(root: Path) -> None:
+    hidden = [".obsidian/app.json", ".hidden.md", ".trash/z.md", "node_modules/x.md", "sub/Excalidraw-cache/y.md"]
+    for rel in ["a.md", "sub/b.md", "sub/c.canvas", *hidden]:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(rel, encoding="utf-8")
+
+
+def test_iter_files_skips_hidden_and_ignored_entries(tmp_path: Path) -> None:
+    _make_vault(tmp_path)
+    found = {Path(e.path).relative_to(tmp_path).as_posix() for e in dropbox_sync._iter_files(str(tmp_path))}
+    assert found == {"a.md", "sub/b.md", "sub/c.canvas"}
+    only_md = {e.name for e in dropbox_sync._iter_files(str(tmp_path), frozenset({".md"}))}
+    assert only_md == {"a.md", "b.md"}
+
+
+def test_hash_cache_invalidates_on_mtime_or_size_change(tmp_path: Path) -> None:
+    cache = HashCache(tmp_path / "hashes.sqlite3")
+    cache.set("/v/a.md", 100, 3, "h1")
+    assert cache.get("/v/a.md", 100, 3) == "h1"
+    assert cache.get("/v/a.md", 101, 3) is None
+    assert cache.get("/v/a.md", 100, 4) is None
+    assert cache.get("/v/b.md", 100, 3) is None
+    cache.close()
+
+
+class _FakeDropbox:
+    """Serves a fixed remote listing and records uploads from all threads."""
+
+    def __init__(self, remote: dict) -> None:
+        self.remote = remote
+        self.uploads = {}
+        self.lock = threading.Lock()
+
+    def files_list_folder(self, path, recursive=False):
+        entries = [types.SimpleNamespace(path_lower=p, content_hash=h) for p, h in self.remote.items()]
+        return types.SimpleNamespace(entries=entries, has_more=False, cursor=None)
+
+    def files_upload(self, data, path, mode=None):
+        with self.lock:
+            self.uploads[path] = data
+
+
+def test_incremental_sync_uploads_only_changed_files(tmp_path: Path, monkeypatch) -> None:
+    vault = tmp_path / "vault"
+    _make_vault(vault)
+    fake = _FakeDropbox({"/remote/a.md": _reference_hash(b"a.md"), "/remote/sub/b.md": "stale"})
+    manager = VaultSyncManager("token", max_workers=4, hash_cache_path=str(tmp_path / "hashes.sqlite3"))
+    manager.dbx = fake
+    monkeypatch.setattr(manager, "_client", lambda: fake)
+    manager.incremental_sync(str(vault), "/remote")
+    assert fake.uploads == {"/remote/sub/b.md": b"sub/b.md", "/remote/sub/c.canvas": b"sub/c.canvas"}
+
+    # Hashes of unchanged files come from the cache on the next pass
+    monkeypatch.setattr(manager, "_file_hash", lambda path: pytest.fail(f"re-hashed {path}"))
+    fake.remote.update({f"/remote/{k}": _reference_hash(k.encode()) for k in ["sub/b.md", "sub/c.canvas"]})
+    fake.uploads.clear()
+    manager.incremental_sync(str(vault), "/remote")
+    assert fake.uploads == {}
+
+
+def test_remote_hashes_treats_missing_folder_as_empty() -> None:
+    from dropbox.exceptions import ApiError
+    from dropbox.files import ListFolderError, LookupError
+
+    manager = VaultSyncManager("token")
+
+    def raise_error(error):
+        def list_folder(path, recursive=False):
+            raise ApiError("req", error, None, None)
+        return list_folder
+
+    manager.dbx = types.SimpleNamespace(files_list_folder=raise_error(ListFolderError.path(LookupError.not_found)))
+    assert manager._remote_hashes("/remote") == {}
+    restricted = ListFolderError.path(LookupError.restricted_content)
+    manager.dbx = types.SimpleNamespace(files_list_folder=raise_error(restricted))
+    with pytest.raises(ApiError):
+        manager._remote_hashes("/remote")
@@ -0,0 +1,77 @@
+"""Tests for ``obskg.embeddings``."""
+
+import types
+
+import numpy as np
+
+from obskg import embeddings as embeddings_mod
+from obskg.embeddings import EmbeddingConfig, embed_texts
+
+
+def test_openai_client_is_shared_and_inputs_batched(monkeypatch) -> None:
+    clients = []
+    batches = []
+
+    class FakeOpenAI:
+        def __init__(self, api_key):
+            clients.append(api_key)
+            self.embeddings = types.SimpleNamespace(create=self.create)
+
+        def create(self, input, model):
+            batches.append(len(input))
+            return types.SimpleNamespace(data=[types.SimpleNamespace(embedding=[float(t), 0.0]) for t in input])
+
+    monkeypatch.setattr(embeddings_mod, "OpenAI", FakeOpenAI)
+    monkeypatch.setattr(embeddings_mod, "OPENAI_BATCH_SIZE", 4)
+    embeddings_mod.openai_client.cache_clear()
+    config = EmbeddingConfig(provider="openai", api_key="key")
+    texts = [str(i) for i in range(10)]
+    vectors = embed_texts(texts, config)
+    embed_texts(texts[:1], config)
+    embeddings_mod.openai_client.cache_clear()
+    assert clients == ["key"]
+    assert batches == [4, 4, 2, 1]
+    assert np.array_equal(np.stack(vectors)[:, 0], np.arange(10))
+
+
+class _StubSentenceTransformer:
+    loads = []
+
+    def __init__(self, model_name, device=None):
+        _StubSentenceTransformer.loads.append((model_name, device))
+        self.model_name = model_name
+
+    def encode(self, texts, batch_size, convert_to_numpy, normalize_embeddings, show_progress_bar):
+        assert normalize_embeddings and convert_to_numpy
+        vectors = np.array([[len(t), 1.0, 2.0] for t in texts], dtype=np.float64)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def test_local_models_cached_per_device_and_evicted(monkeypatch) -> None:
+    monkeypatch.setattr(embeddings_mod, "SentenceTransformer", _StubSentenceTransformer)
+    monkeypatch.setattr(embeddings_mod, "MAX_LOCAL_MODELS", 2)
+    _StubSentenceTransformer.loads = []
+    embeddings_mod.clear_models()
+    load = embeddings_mod._load_local_model
+    first = load("a")
+    assert load("a") is first
+    assert load("a", "cpu") is not first  # None lets the library pick the device
+    load("a")  # Most recently used, so ("a", "cpu") is evicted next
+    load("b")
+    assert list(embeddings_mod._MODEL_CACHE) == [("a", None), ("b", None)]
+    load("a", "cpu")
+    assert _StubSentenceTransformer.loads == [("a", None), ("a", "cpu"), ("b", None), ("a", "cpu")]
+    embeddings_mod.clear_models()
+    assert not embeddings_mod._MODEL_CACHE
+    assert load("a") is not first
+
+
+def test_local_encode_returns_unit_float32_rows(monkeypatch) -> None:
+    monkeypatch.setattr(embeddings_mod, "SentenceTransformer", _StubSentenceTransformer)
+    embeddings_mod.clear_models()
+    vectors = embed_texts(["x", "four", "sixteen chars..."], EmbeddingConfig(provider="local", model="stub"))
+    embeddings_mod.clear_models()
+    assert len(vectors) == 3
+    assert all(v.shape == (3,) and v.dtype == np.float32 for v in vectors)
+    assert np.allclose([np.linalg.norm(v) for v in vectors], 1.0)
+    assert vectors[0][0] < vectors[2][0]
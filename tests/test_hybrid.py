@@ -0,0 +1,32 @@
+"""Tests for ``obskg.workflows.hybrid.HybridTaskRouter``."""
+
+import pytest
+
+from obskg.workflows.hybrid import HybridTaskRouter
+
+# Decisions of the original, unmemoized router per complexity band
+_EXPECTED = {
+    "transcription": [("ai", 0.95), ("collaborative", 0.7), ("collaborative", 0.6)],
+    "critical_thinking": [("human", 0.5), ("collaborative", 0.7), ("human", 0.95)],
+    "unknown_task": [("collaborative", 0.5), ("collaborative", 0.5), ("collaborative", 0.5)],
+}
+
+
+@pytest.mark.parametrize("task_type", sorted(_EXPECTED))
+@pytest.mark.parametrize(
+    "score, band",
+    [(0.0, 0), (0.29, 0), (0.3, 1), (0.5, 1), (0.7, 1), (float("nan"), 1), (0.71, 2), (1.0, 2)],
+)
+def test_route_matches_original_decisions(task_type: str, score: float, band: int) -> None:
+    router = HybridTaskRouter()
+    handler, confidence = _EXPECTED[task_type][band]
+    for _ in range(2):  # Second call is served from the memo
+        assert router.route(task_type, score) == {"handler": handler, "confidence": confidence}
+
+
+def test_route_results_are_independent_copies() -> None:
+    router = HybridTaskRouter(ai_first_tasks=["custom"])
+    decision = router.route("custom", 0.1)
+    decision["handler"] = "human"
+    assert router.route("custom", 0.2) == {"handler": "ai", "confidence": 0.95}
+    assert HybridTaskRouter().route("custom", 0.1)["handler"] == "collaborative"
@@ -0,0 +1,19 @@
+"""Tests for ``obskg.monitoring.metrics.MetricsCollector``."""
+
+import pytest
+
+from obskg.monitoring.metrics import MetricsCollector
+
+
+def test_report_averages_tracked_queries() -> None:
+    collector = MetricsCollector()
+    assert collector.generate_report() == {"TTI": 0.0, "KRR": 0.0, "SV": 0.0, "CLI": 0.0, "AAR": 0.0}
+    collector.track_query(10.0, 12.0, notes_accessed=4)
+    collector.track_query(20.0, 21.0, notes_accessed=1)
+    collector.track_query(30.0, 30.0, notes_accessed=0)
+    report = collector.generate_report()
+    assert report["TTI"] == pytest.approx(1.0)
+    assert report["SV"] == pytest.approx((2.0 + 1.0 + 0.0) / 3)
+    assert report["CLI"] == pytest.approx((0.25 + 1.0 + 1.0) / 3)
+    assert report["AAR"] == pytest.approx(0.5)
+    assert collector.metrics["TTI"].count == 3
@@ -0,0 +1,44 @@
+"""Tests for the watchdog helpers in ``obskg.scheduler``."""
+
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("watchdog")
+
+from watchdog.events import FileModifiedEvent, FileMovedEvent
+
+from obskg.scheduler import VaultEventHandler
+
+
+def test_vault_event_handler_debounces_and_filters(tmp_path: Path) -> None:
+    calls = []
+    handler = VaultEventHandler(calls.append, debounce=0.05, root=tmp_path)
+    note = tmp_path / "note.md"
+    for _ in range(5):
+        handler.dispatch(FileModifiedEvent(str(note)))
+    handler.dispatch(FileMovedEvent(str(tmp_path / ".note.md.tmp"), str(note)))
+    handler.dispatch(FileModifiedEvent(str(tmp_path / ".obsidian" / "workspace.md")))
+    handler.dispatch(FileModifiedEvent(str(tmp_path / "note.md~")))
+    handler.dispatch(FileModifiedEvent(str(tmp_path / "image.png")))
+    time.sleep(0.3)
+    assert calls == [note]
+
+
+def test_vault_event_handler_accepts_unresolved_roots(tmp_path: Path, monkeypatch) -> None:
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(vault, target_is_directory=True)
+    monkeypatch.chdir(tmp_path)
+    calls = []
+    # Relative root with absolute event paths, and events reported through a symlink
+    for root in (Path("vault"), link):
+        handler = VaultEventHandler(calls.append, debounce=0.01, root=root)
+        handler.dispatch(FileModifiedEvent(str(vault / "note.md")))
+        handler.dispatch(FileModifiedEvent(str(vault / ".trash" / "old.md")))
+        # Paths that cannot be placed under the root are ignored, not raised on
+        handler.dispatch(FileModifiedEvent(str(tmp_path / "elsewhere" / "other.md")))
+    time.sleep(0.2)
+    assert calls == [vault / "note.md"] * 2
@@ -0,0 +1,221 @@
+"""Tests for individual phases of the SPARK workflow."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from obskg.workflows.spark import SPARKProducer
+
+
+def test_producer_writes_reports(tmp_path: Path) -> None:
+    reports = [{"analysis_id": i, "text": "naïve ☃"} for i in range(5)]
+    reports.append({"analysis_id": "bad", "value": object()})
+    written = SPARKProducer().produce(reports, str(tmp_path / "out"))
+    assert [p.name for p in written] == [f"spark_report_{i}.json" for i in range(5)]
+    assert json.loads(written[3].read_text(encoding="utf-8")) == {"analysis_id": 3, "text": "naïve ☃"}
+    assert not (tmp_path / "out" / "spark_report_bad.json").exists()
+
+
+class _FakeSession:
+    instances = 0
+
+    def __init__(self, connector):
+        _FakeSession.instances += 1
+        self.connector = connector
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def test_scanner_fetches_sources_concurrently(monkeypatch) -> None:
+    import asyncio
+    import types
+
+    from obskg.workflows.spark import scanner as scanner_module
+
+    fake_aiohttp = types.SimpleNamespace(ClientSession=_FakeSession, TCPConnector=dict)
+    monkeypatch.setattr(scanner_module, "aiohttp", fake_aiohttp)
+    in_flight = []
+
+    async def fetch_one(self, session, source):
+        in_flight.append(source)
+        await asyncio.sleep(0.01)
+        if source == "bad":
+            raise OSError("unreachable")
+        # Every request has started before any of them completes
+        assert len(in_flight) == 3
+        return f"body of {source}"
+
+    monkeypatch.setattr(scanner_module.SPARKScanner, "_fetch_one", fetch_one)
+    scanner = scanner_module.SPARKScanner({"sources": ["a", "bad", "b"], "max_connections_per_host": 2})
+    assert scanner.scan() == ["body of a", "body of b"]
+    # scan() closes the session it created in its own event loop
+    assert scanner._session is None
+
+
+def test_scanner_reuses_session_until_closed(monkeypatch) -> None:
+    import asyncio
+    import types
+
+    from obskg.workflows.spark import scanner as scanner_module
+
+    fake_aiohttp = types.SimpleNamespace(ClientSession=_FakeSession, TCPConnector=dict)
+    monkeypatch.setattr(scanner_module, "aiohttp", fake_aiohttp)
+
+    async def fetch_one(self, session, source):
+        return source
+
+    monkeypatch.setattr(scanner_module.SPARKScanner, "_fetch_one", fetch_one)
+    scanner = scanner_module.SPARKScanner({"sources": ["a"]})
+
+    async def main():
+        created = _FakeSession.instances
+        assert await scanner.scan_async() == ["a"]
+        session = scanner._session
+        assert await scanner.scan_async() == ["a"]
+        assert scanner._session is session
+        assert _FakeSession.instances == created + 1
+        assert session.connector == {"limit": 64, "limit_per_host": 8}
+        await scanner.aclose()
+        assert session.closed and scanner._session is None
+
+    asyncio.run(main())
+
+
+def test_scanner_falls_back_to_urllib_without_aiohttp(tmp_path: Path, monkeypatch) -> None:
+    from obskg.workflows.spark import scanner as scanner_module
+
+    page = tmp_path / "page.txt"
+    page.write_text("naïve", encoding="utf-8")
+    assert scanner_module.SPARKScanner()._fetch_blocking(page.as_uri()) == "naïve"
+
+    def fetch_blocking(self, source):
+        if source == "bad":
+            raise OSError("unreachable")
+        return f"body of {source}"
+
+    monkeypatch.setattr(scanner_module, "aiohttp", None)
+    monkeypatch.setattr(scanner_module.SPARKScanner, "_fetch_blocking", fetch_blocking)
+    scanner = scanner_module.SPARKScanner({"sources": ["a", "bad", "b"]})
+    assert scanner.scan() == ["body of a", "body of b"]
+
+
+def test_pipeline_streams_stages(tmp_path: Path) -> None:
+    import asyncio
+
+    from obskg.workflows.spark import SPARKPipeline
+
+    pipeline = SPARKPipeline(vault_path=str(tmp_path))
+    contents = [f"Paragraph about topic{i}.\n\nAnother paragraph here." for i in range(100)]
+
+    async def scan_async():
+        return contents
+
+    pipeline.scanner.scan_async = scan_async
+    results = asyncio.run(pipeline.run())
+    assert results["num_sources"] == 100
+    assert results["num_atomic_notes"] == 200
+    assert results["num_produced"] == 1
+
+
+@pytest.mark.parametrize("failing", ["scan", "process", "analyze"])
+def test_pipeline_stage_failure_does_not_hang(tmp_path: Path, failing: str) -> None:
+    import asyncio
+
+    from obskg.workflows.spark import SPARKPipeline
+
+    pipeline = SPARKPipeline(vault_path=str(tmp_path))
+    # Enough notes to fill both queues, so healthy stages block on ``put``
+    contents = [f"Paragraph {i}.\n\nAnother paragraph." for i in range(500)]
+
+    async def scan_async():
+        if failing == "scan":
+            raise OSError("scan failed")
+        return contents
+
+    def fail(*args):
+        raise RuntimeError(f"{failing} failed")
+
+    pipeline.scanner.scan_async = scan_async
+    if failing == "process":
+        pipeline.processor.process = fail
+    elif failing == "analyze":
+        pipeline.analyzer.analyze = fail
+
+    async def run():
+        return await asyncio.wait_for(pipeline.run(), timeout=10)
+
+    with pytest.raises((OSError, RuntimeError), match=f"{failing} failed"):
+        asyncio.run(run())
+
+
+def test_processor_tags() -> None:
+    from obskg.workflows.spark import SPARKProcessor
+    from obskg.workflows.spark.processor import AtomicNote
+
+    text = "(Graph) theory, graph THEORY: don't hello-world naïve networks! tiny words abc12 routing"
+    notes = SPARKProcessor().process(text + "\n\nSecond paragraph.")
+    assert [n.tags for n in notes] == [["graph", "theory", "naïve"], ["second", "paragraph"]]
+    note = AtomicNote(content=text, tags=[], connections=[])
+    assert SPARKProcessor().auto_tag(note) == ["graph", "theory", "naïve", "networks", "words"]
+
+
+def test_auto_tag_is_memoized() -> None:
+    from obskg.workflows.spark import SPARKProcessor
+    from obskg.workflows.spark.processor import AtomicNote, _tags_for
+
+    note = AtomicNote(content="memoized content words", tags=[], connections=[])
+    first = SPARKProcessor().auto_tag(note)
+    first.append("mutated")  # callers get a fresh list each time
+    hits = _tags_for.cache_info().hits
+    assert SPARKProcessor().auto_tag(note) == ["memoized", "content", "words"]
+    assert _tags_for.cache_info().hits == hits + 1
+
+
+def test_refiner_bounds_concurrency() -> None:
+    import asyncio
+
+    from obskg.workflows.spark import SPARKRefiner
+
+    refiner = SPARKRefiner()
+    active = []
+    peak = []
+
+    async def refine_one(report):
+        active.append(report)
+        peak.append(len(active))
+        await asyncio.sleep(0.001)
+        active.remove(report)
+        return {"refined": report["id"]}
+
+    refiner._refine_one = refine_one
+    reports = [{"id": i} for i in range(10)]
+    assert asyncio.run(refiner.refine(reports, concurrency=3)) == [{"refined": i} for i in range(10)]
+    assert max(peak) == 3
+    assert asyncio.run(SPARKRefiner().refine({"id": 0})) == [{"id": 0}]
+
+
+def test_analyzer_consumes_generator() -> None:
+    from obskg.workflows.spark import SPARKAnalyzer
+    from obskg.workflows.spark.processor import AtomicNote
+
+    notes = (AtomicNote(content="", tags=tags, connections=[]) for tags in (["graph"], [], ["graph", "theory"]))
+    report = SPARKAnalyzer().analyze(notes)
+    assert report["patterns"] == [{"pattern": "graph", "count": 2}, {"pattern": "misc", "count": 1}]
+    assert [n["label"] for n in report["visual_graph"]["nodes"]] == ["graph", "note-1", "graph"]
+
+
+def test_producer_aggregates_jsonl(tmp_path: Path) -> None:
+    reports = [{"analysis_id": i, "text": "naïve\nline"} for i in range(3)]
+    reports.insert(1, {"analysis_id": "bad", "value": object()})
+    written = SPARKProducer().produce(reports, str(tmp_path), aggregate=True)
+    assert [p.name for p in written] == ["spark_reports.jsonl"]
+    lines = written[0].read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == [{"analysis_id": i, "text": "naïve\nline"} for i in range(3)]
+    assert list(tmp_path.iterdir()) == written
+    # A later run appends instead of discarding earlier reports
+    SPARKProducer().produce([{"analysis_id": 3}], str(tmp_path), aggregate=True)
+    lines = written[0].read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["analysis_id"] for line in lines] == [0, 1, 2, 3]
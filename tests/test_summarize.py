@@ -0,0 +1,140 @@
+"""Tests for the map-reduce helpers in ``obskg.summarize``."""
+
+import threading
+import time
+
+from obskg import summarize
+from obskg.summarize import SummarizationConfig, summarize_document
+
+
+def test_summarize_document_preserves_chunk_order(monkeypatch) -> None:
+    calls = []
+    lock = threading.Lock()
+
+    def fake_call(prompt: str, config: SummarizationConfig) -> str:
+        with lock:
+            calls.append(prompt)
+        if prompt.startswith("Combine"):
+            return prompt
+        # Finish later chunks first to exercise out-of-order completion
+        word = prompt.split()[-1]
+        time.sleep(0.01 if word == "alpha" else 0.0)
+        return f"summary of {word}"
+
+    monkeypatch.setattr(summarize, "_call_openai", fake_call)
+    config = SummarizationConfig(max_concurrency=3)
+    text = " ".join(["alpha", "bravo", "charlie"])
+    result = summarize_document(text, config, max_tokens=102, prompt="Summarize.")
+    assert result.index("summary of alpha") < result.index("summary of bravo") < result.index("summary of charlie")
+
+
+def test_call_openai_cache(tmp_path, monkeypatch) -> None:
+    calls = []
+
+    def fake_call(prompt: str, config: SummarizationConfig) -> str:
+        calls.append(prompt)
+        return f"answer {len(calls)}"
+
+    cached = summarize._cached(fake_call)
+    config = SummarizationConfig(cache_path=str(tmp_path / "responses.sqlite3"))
+    assert cached("What is a zettel?", config) == "answer 1"
+    assert cached("What is a zettel?", config) == "answer 1"
+    assert cached("What is a zettel?", SummarizationConfig(cache_path=config.cache_path, model="other")) == "answer 2"
+    assert cached("What is a zettel?", SummarizationConfig(cache_path=config.cache_path, max_tokens=64)) == "answer 3"
+    assert len(calls) == 3
+
+
+def test_chunk_text_prefers_sentence_boundaries() -> None:
+    text = "One two three. Four five six seven. Eight nine ten eleven twelve."
+    chunks = summarize._chunk_text(text, max_chars=40)
+    assert chunks == ["One two three. Four five six seven.", "Eight nine ten eleven twelve."]
+    assert all(len(c) <= 40 for c in summarize._chunk_text(text * 20, max_chars=40))
+    assert summarize._chunk_text("x" * 10, max_chars=4) == ["xxxx", "xxxx", "xx"]
+
+
+def test_chunk_text_non_positive_max_chars_terminates(monkeypatch) -> None:
+    assert summarize._chunk_text("ab c", max_chars=0) == ["a", "b", "c"]
+    assert summarize._chunk_text("ab", max_chars=-4) == ["a", "b"]
+    monkeypatch.setattr(summarize, "_call_openai", lambda prompt, config: prompt.split()[-1])
+    config = SummarizationConfig(dedup_threshold=None)
+    assert summarize_document("x", config, max_tokens=50, prompt="Summarize.") == "x"
+
+
+def test_chunk_text_overlaps_boundary_sentences() -> None:
+    sentences = [f"Sentence {i} here." for i in range(40)]
+    text = " ".join(sentences)
+    chunks = summarize._chunk_text(text, max_chars=120, overlap_sentences=3)
+    split = [summarize._SENTENCE_SPLIT.split(chunk) for chunk in chunks]
+    assert len(chunks) > 2 and all(len(c) <= 120 for c in chunks)
+    for prev, cur in zip(split, split[1:]):
+        # Consecutive chunks share their boundary sentences and move forward
+        assert cur[:3] == prev[-3:]
+        assert sentences.index(cur[0]) > sentences.index(prev[0])
+    assert split[0][0] == sentences[0] and split[-1][-1] == sentences[-1]
+    # The overlap never exceeds half a chunk, so long sentences still advance
+    long_text = " ".join(["word " * 15 + "end."] * 6)
+    assert len(summarize._chunk_text(long_text, max_chars=100, overlap_sentences=3)) < 10
+    assert summarize._chunk_text("ab c", max_chars=0, overlap_sentences=3) == ["a", "b", "c"]
+
+
+def test_dedup_summaries_drops_repeated_sentences() -> None:
+    summaries = [
+        "The note explains spaced repetition. It cites Ebbinghaus.",
+        "The note explains spaced repetition! Reviews are scheduled by difficulty.",
+        "the note explains spaced repetition.",
+    ]
+    assert summarize._dedup_summaries(summaries, 0.75) == [
+        "The note explains spaced repetition. It cites Ebbinghaus.",
+        "Reviews are scheduled by difficulty.",
+    ]
+
+
+def test_summarize_document_reduces_in_a_tree(monkeypatch) -> None:
+    reduce_inputs = []
+    lock = threading.Lock()
+
+    def fake_call(prompt: str, config: SummarizationConfig) -> str:
+        if prompt.startswith("Combine"):
+            parts = prompt.split("\n\n")[1:]
+            with lock:
+                reduce_inputs.append(len(parts))
+            return "+".join(parts)
+        return prompt.split()[-1]
+
+    monkeypatch.setattr(summarize, "_call_openai", fake_call)
+    config = SummarizationConfig(reduce_group_size=3, dedup_threshold=None)
+    words = [f"w{i}" for i in range(7)]
+    result = summarize_document(" ".join(words), config, max_tokens=101, prompt="Summarize.")
+    assert result == "+".join(words)
+    assert reduce_inputs == [3, 3, 3]
+
+
+def test_summarize_document_blank_input(monkeypatch) -> None:
+    monkeypatch.setattr(summarize, "_call_openai", lambda prompt, config: "")
+    config = SummarizationConfig()
+    assert summarize_document("", config) == ""
+    assert summarize_document("   \n ", config) == ""
+    assert summarize_document("word " * 2000, config, max_tokens=200) == ""
+    # De-duplication can leave nothing to reduce
+    assert summarize._reduce([], config, None) == ""
+
+
+def test_semantic_cache_scoped_to_model_and_system_prompt(tmp_path, monkeypatch) -> None:
+    from obskg.embeddings import EmbeddingConfig
+
+    calls = []
+
+    def fake_call(prompt: str, config: SummarizationConfig) -> str:
+        calls.append(prompt)
+        return f"answer {len(calls)}"
+
+    # Every prompt embeds to the same vector, so only the scope tells them apart
+    monkeypatch.setattr(summarize, "embed_texts", lambda texts, config: [[1.0, 0.0]] * len(texts))
+    cached = summarize._cached(fake_call)
+    base = dict(cache_path=str(tmp_path / "responses.sqlite3"), temperature=0.0, embedding=EmbeddingConfig())
+    assert cached("What is a zettel?", SummarizationConfig(**base)) == "answer 1"
+    assert cached("Define a zettel.", SummarizationConfig(**base)) == "answer 1"
+    assert cached("Define a zettel.", SummarizationConfig(**base, system_prompt="Answer in French.")) == "answer 2"
+    assert cached("Define a zettel.", SummarizationConfig(**base, model="other")) == "answer 3"
+    assert cached("Define a zettel.", SummarizationConfig(**base, max_tokens=64)) == "answer 4"
+    assert len(calls) == 4
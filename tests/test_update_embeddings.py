@@ -0,0 +1,115 @@
+"""Tests for the incremental indexing in ``scripts/update_embeddings.py``."""
+
+import hashlib
+import importlib.util
+import os
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from obskg.vectorstore import FaissVectorStore
+
+_SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "update_embeddings.py"
+
+
+@pytest.fixture
+def update(tmp_path: Path, monkeypatch):
+    spec = importlib.util.spec_from_file_location("update_embeddings", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    calls = []
+
+    def fake_embed(texts, config):
+        calls.append(list(texts))
+        # Deterministic unit vectors derived from the text
+        seeds = [int.from_bytes(hashlib.sha256(t.encode()).digest()[:4], "little") for t in texts]
+        vectors = [np.random.default_rng(seed).standard_normal(8).astype(np.float32) for seed in seeds]
+        return [v / np.linalg.norm(v) for v in vectors]
+
+    monkeypatch.setattr(module, "embed_texts", fake_embed)
+    vault = tmp_path / "vault"
+    vault.mkdir()
+    argv = [
+        "--vault", str(vault),
+        "--index", str(tmp_path / "index.faiss"),
+        "--meta", str(tmp_path / "meta.sqlite3"),
+        "--cache", str(tmp_path / "cache.sqlite3"),
+        "--openai-key", "key",
+        "--workers", "4",
+    ]
+
+    def run():
+        calls.clear()
+        assert module.main(argv) == 0
+        return calls
+
+    return vault, run
+
+
+def _indexed(tmp_path: Path) -> dict:
+    store = FaissVectorStore(index_path=str(tmp_path / "index.faiss"), meta_path=str(tmp_path / "meta.sqlite3"))
+    try:
+        hashes = store.content_hashes()
+        assert store.index.ntotal == len(hashes)
+        return {Path(path).relative_to(tmp_path / "vault").as_posix(): h for path, h in hashes.items()}
+    finally:
+        store.persist()
+
+
+def _cache_rows(tmp_path: Path) -> int:
+    conn = sqlite3.connect(str(tmp_path / "cache.sqlite3"))
+    try:
+        return conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_incremental_runs_embed_only_new_content(tmp_path: Path, update) -> None:
+    vault, run = update
+    (vault / "a.md").write_text("alpha", encoding="utf-8")
+    (vault / "b.md").write_text("beta", encoding="utf-8")
+    (vault / "c.md").write_text("alpha", encoding="utf-8")
+
+    # Duplicate content is embedded once, in a single batched call
+    calls = run()
+    assert len(calls) == 1 and sorted(calls[0]) == ["alpha", "beta"]
+    indexed = _indexed(tmp_path)
+    assert sorted(indexed) == ["a.md", "b.md", "c.md"]
+    assert indexed["a.md"] == indexed["c.md"]
+    assert _cache_rows(tmp_path) == 2
+
+    # Nothing changed
+    assert run() == []
+
+    # Touched: the content hash matches, and the refreshed manifest means
+    # the note is not even read on the following run
+    st = (vault / "a.md").stat()
+    os.utime(vault / "a.md", (st.st_atime, st.st_mtime + 10))
+    assert run() == []
+    store = FaissVectorStore(index_path=str(tmp_path / "index.faiss"), meta_path=str(tmp_path / "meta.sqlite3"))
+    assert store.manifest()[str(vault / "a.md")][0] == st.st_mtime + 10
+    store.persist()
+
+    # Moved: the content-addressed cache supplies the vector
+    (vault / "sub").mkdir()
+    (vault / "b.md").rename(vault / "sub" / "b.md")
+    assert run() == []
+    assert sorted(_indexed(tmp_path)) == ["a.md", "c.md", "sub/b.md"]
+
+    # Modified: exactly one call, and the note's vector is replaced
+    (vault / "c.md").write_text("gamma", encoding="utf-8")
+    assert run() == [["gamma"]]
+    indexed = _indexed(tmp_path)
+    assert sorted(indexed) == ["a.md", "c.md", "sub/b.md"]
+    assert indexed["c.md"] != indexed["a.md"]
+    assert _cache_rows(tmp_path) == 3
+
+    # Deleted: the vector goes, and so does the cache row only it used
+    (vault / "c.md").unlink()
+    assert run() == []
+    assert sorted(_indexed(tmp_path)) == ["a.md", "sub/b.md"]
+    assert _cache_rows(tmp_path) == 2
@@ -0,0 +1,107 @@
+"""Tests for vault scanning in ``obskg.vault``."""
+
+from pathlib import Path
+
+import pytest
+
+from obskg.vault import iter_note_meta, iter_notes, load_note
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_iter_notes_skips_hidden_directories(tmp_path: Path) -> None:
+    vault = tmp_path / "Vault"
+    _write(vault / "a.md", "alpha")
+    _write(vault / "sub" / "B.MD", "beta")
+    _write(vault / "sub" / "image.png", "not a note")
+    _write(vault / ".obsidian" / "workspace.md", "config")
+    _write(vault / ".trash" / "old.md", "deleted")
+    notes = sorted(iter_notes([vault]), key=lambda n: n.title)
+    assert [(n.vault, n.title, n.content) for n in notes] == [("Vault", "B", "beta"), ("Vault", "a", "alpha")]
+
+
+def test_iter_notes_skips_files_in_manifest(tmp_path: Path) -> None:
+    vault = tmp_path / "Vault"
+    _write(vault / "same.md", "unchanged")
+    _write(vault / "edited.md", "old")
+    first = {str(n.path): (n.mtime, n.size) for n in iter_notes([vault])}
+    _write(vault / "edited.md", "new and longer")
+    _write(vault / "added.md", "fresh")
+    assert sorted(n.title for n in iter_notes([vault], manifest=first)) == ["added", "edited"]
+
+
+def test_manifest_matches_notes_of_relative_vault(tmp_path: Path, monkeypatch) -> None:
+    vault = tmp_path / "Vault"
+    _write(vault / "same.md", "unchanged")
+    _write(vault / "sub" / "deep.md", "nested")
+    monkeypatch.chdir(vault)
+    # Keyed the way scripts/update_embeddings.py writes it
+    manifest = {str(n.path): (n.mtime, n.size) for n in iter_notes([Path(".")])}
+    assert sorted(manifest) == ["same.md", "sub/deep.md"]
+    assert list(iter_note_meta([Path(".")], manifest=manifest)) == []
+
+
+def test_iter_notes_normalizes_to_nfc(tmp_path: Path) -> None:
+    vault = tmp_path / "Vault"
+    _write(vault / "cafe.md", "café")
+    (note,) = iter_notes([vault])
+    assert note.content == "café"
+
+
+def test_front_matter_fast_path_matches_yaml() -> None:
+    yaml = pytest.importorskip("yaml")
+    from obskg.vault import _load_front_matter
+
+    cases = [
+        "title: Hello world\nauthor: Jane Doe",
+        "created: 2024-01-01\ndraft: yes\nrating: 4",
+        "url: http://example.com/a:b\ntags: [x, y]",
+        "parent:\n  child: value",
+        "note: text # comment",
+    ]
+    for text in cases:
+        assert _load_front_matter(text) == yaml.safe_load(text)
+
+
+def test_parse_front_matter_delimiters() -> None:
+    pytest.importorskip("yaml")
+    from obskg.vault import _parse_front_matter
+
+    assert _parse_front_matter("---\ntitle: a-\n---\n\nIntro\n---\nOutro") == ({"title": "a-"}, "Intro\n---\nOutro")
+    assert _parse_front_matter("---\n---\nbody") == ({}, "body")
+    assert _parse_front_matter("---\nunterminated") == ({}, "---\nunterminated")
+
+
+def test_iter_notes_applies_ignore_files(tmp_path: Path) -> None:
+    pytest.importorskip("pathspec")
+    vault = tmp_path / "Vault"
+    _write(vault / ".gitignore", "Templates/\n")
+    _write(vault / ".obsidianignore", "*.excalidraw.md\n!keep.excalidraw.md\n")
+    _write(vault / "note.md", "kept")
+    _write(vault / "Templates" / "daily.md", "template")
+    _write(vault / "drawing.excalidraw.md", "drawing")
+    _write(vault / "keep.excalidraw.md", "kept drawing")
+    assert sorted(n.path.name for n in iter_notes([vault])) == ["keep.excalidraw.md", "note.md"]
+    assert len(list(iter_notes([vault], use_ignore_files=False))) == 4
+
+
+def test_iter_note_meta_does_not_read_files(tmp_path: Path, monkeypatch) -> None:
+    _write(tmp_path / "a.md", "---\ntitle: Alpha\n---\nbody")
+    read_text = Path.read_text
+
+    def no_notes_read(path: Path, *args, **kwargs) -> str:
+        if path.suffix == ".md":
+            pytest.fail("note was read")
+        return read_text(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "read_text", no_notes_read)
+    metas = list(iter_note_meta([tmp_path]))
+    monkeypatch.undo()
+    assert [(m.vault, m.path.name, m.size) for m in metas] == [(tmp_path.name, "a.md", 25)]
+    note = load_note(metas[0])
+    assert (note.title, note.content, note.mtime) == ("Alpha", "body", metas[0].mtime)
+    metas[0].path.unlink()
+    assert load_note(metas[0]) is None
@@ -0,0 +1,234 @@
+"""Tests for ``obskg.vectorstore.FaissVectorStore``."""
+
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("faiss")
+
+from obskg.vectorstore import FaissVectorStore
+
+
+def _store(tmp_path: Path, **kwargs) -> FaissVectorStore:
+    return FaissVectorStore(index_path=str(tmp_path / "index.faiss"), meta_path=str(tmp_path / "meta.sqlite3"), **kwargs)
+
+
+def test_search_returns_metadata_in_rank_order(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.add_vectors(
+        [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.7, 0.7, 0.0]],
+        [{"title": "x"}, {"title": "y"}, {"title": "xy", "extra": {"tags": ["a"]}}],
+    )
+    results = store.search([1.0, 0.1, 0.0], top_k=5)
+    assert [meta["title"] for _, meta in results] == ["x", "xy", "y"]
+    assert results[1][1]["extra"] == {"tags": ["a"]}
+    assert results[0][0] >= results[1][0] >= results[2][0]
+
+
+def test_add_vectors_accepts_2d_array_without_modifying_it(tmp_path: Path) -> None:
+    import numpy as np
+
+    store = _store(tmp_path)
+    vectors = np.array([[3.0, 0.0], [0.0, 4.0]], dtype=np.float32)
+    store.add_vectors(vectors, [{"title": "x"}, {"title": "y"}])
+    assert np.array_equal(vectors, [[3.0, 0.0], [0.0, 4.0]])
+    assert store.search([0.0, 1.0], top_k=1)[0][1]["title"] == "y"
+
+
+@pytest.mark.parametrize("index_type", ["hnsw", "ivfpq"])
+def test_approximate_indexes_find_exact_match(tmp_path: Path, index_type: str) -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((400, 16)).astype(np.float32)
+    store = _store(tmp_path, index_type=index_type, nlist=4, pq_m=4, train_size=256)
+    store.add_vectors(vectors[:300], [{"title": str(i)} for i in range(300)])
+    store.add_vectors(vectors[300:], [{"title": str(i)} for i in range(300, 400)])
+    results = store.search(vectors[42], top_k=3, ef_search=128, nprobe=4)
+    assert results[0][1]["title"] == "42"
+    store.persist()
+    reloaded = _store(tmp_path, index_type=index_type)
+    assert reloaded.search(vectors[350], top_k=1, nprobe=4)[0][1]["title"] == "350"
+
+
+def test_manifest_roundtrip_and_legacy_schema(tmp_path: Path) -> None:
+    import sqlite3
+
+    conn = sqlite3.connect(str(tmp_path / "meta.sqlite3"))
+    conn.execute("CREATE TABLE metadata (id INTEGER PRIMARY KEY, title TEXT, path TEXT, vault TEXT, extra TEXT)")
+    conn.commit()
+    conn.close()
+    store = _store(tmp_path)
+    store.add_vectors([[1.0, 0.0]], [{"title": "a", "path": "/v/a.md", "mtime": 12.5, "size": 3, "content_hash": "h"}])
+    assert store.manifest() == {"/v/a.md": (12.5, 3)}
+    assert store.content_hashes() == {"/v/a.md": "h"}
+    store.update_manifest([("/v/a.md", 20.0, 3)])
+    assert store.manifest() == {"/v/a.md": (20.0, 3)}
+
+
+def test_baseline_index_is_migrated_to_path_ids(tmp_path: Path) -> None:
+    import sqlite3
+
+    import faiss
+    import numpy as np
+
+    from obskg.vectorstore import path_id
+
+    # Layout written before id support: a plain flat index whose metadata ids
+    # are positions, with every note re-added on each run
+    vectors = np.eye(3, dtype=np.float32)[[0, 1, 2, 0]]
+    index = faiss.IndexFlatIP(3)
+    index.add(vectors)
+    faiss.write_index(index, str(tmp_path / "index.faiss"))
+    conn = sqlite3.connect(str(tmp_path / "meta.sqlite3"))
+    conn.execute("CREATE TABLE metadata (id INTEGER PRIMARY KEY, title TEXT, path TEXT, vault TEXT, extra TEXT)")
+    conn.executemany(
+        "INSERT INTO metadata (id, title, path) VALUES (?, ?, ?)",
+        [(0, "a", "/v/a.md"), (1, "b", "/v/b.md"), (2, "c", None), (3, "a2", "/v/a.md")],
+    )
+    conn.commit()
+    conn.close()
+
+    store = _store(tmp_path, delta=True)
+    assert store.index.ntotal == 3
+    assert store.search([1.0, 0.0, 0.0], top_k=1)[0][1]["title"] == "a2"
+    assert store.search([0.0, 0.0, 1.0], top_k=1)[0][1]["title"] == "c"
+    store.add_vectors([[0.0, 0.0, 1.0]], [{"title": "b2", "path": "/v/b.md"}], ids=[path_id("/v/b.md")])
+    titles = [meta["title"] for _, meta in store.search([0.0, 1.0, 1.0], top_k=5)]
+    assert sorted(titles) == ["a2", "b2", "c"]
+    store.persist()
+
+    store = _store(tmp_path)
+    assert isinstance(store.index, faiss.IndexIDMap)
+    rows = store.conn.execute("SELECT id, title FROM metadata ORDER BY title").fetchall()
+    assert rows == [(path_id("/v/a.md"), "a2"), (path_id("/v/b.md"), "b2"), (2, "c")]
+
+
+def test_store_usable_from_worker_threads(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    store = _store(tmp_path)
+
+    def add_and_search(i: int) -> str:
+        store.add_vectors([[float(i), 1.0, 0.5]], [{"title": f"n{i}"}])
+        return store.search([float(i), 1.0, 0.5], top_k=1)[0][1]["title"]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        titles = list(executor.map(add_and_search, range(1, 17)))
+    assert len(titles) == 16
+    assert store.index.ntotal == 16
+    assert store.conn.execute("SELECT COUNT(*) FROM metadata").fetchone()[0] == 16
+
+
+def test_pre_normalized_store_skips_normalization(tmp_path: Path) -> None:
+    import numpy as np
+
+    store = _store(tmp_path, pre_normalized=True)
+    vectors = np.array([[0.6, 0.8], [1.0, 0.0]], dtype=np.float32)
+    store.add_vectors(vectors, [{"title": "a"}, {"title": "b"}])
+    score, meta = store.search(np.array([0.6, 0.8], dtype=np.float32), top_k=1)[0]
+    assert meta["title"] == "a"
+    assert score == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "index_type, quantization",
+    [("flat", "fp16"), ("flat", "int8"), ("flat", "pq"), ("hnsw", "fp16")],
+)
+def test_quantized_indexes_find_exact_match(tmp_path: Path, index_type: str, quantization: str) -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(1)
+    vectors = rng.standard_normal((300, 16)).astype(np.float32)
+    store = _store(tmp_path, index_type=index_type, quantization=quantization, pq_m=8, train_size=256)
+    store.add_vectors(vectors, [{"title": str(i)} for i in range(300)])
+    assert store.search(vectors[7], top_k=1)[0][1]["title"] == "7"
+
+
+def test_unsupported_quantization_rejected(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        _store(tmp_path, index_type="hnsw", quantization="pq")
+
+
+def test_replace_and_remove_by_id(tmp_path: Path) -> None:
+    from obskg.vectorstore import path_id
+
+    store = _store(tmp_path)
+    a, b = path_id("/v/a.md"), path_id("/v/b.md")
+    store.add_vectors([[1.0, 0.0], [0.0, 1.0]], [{"title": "a"}, {"title": "b"}], ids=[a, b])
+    store.add_vectors([[0.0, 1.0]], [{"title": "a v2"}], ids=[a])
+    assert store.index.ntotal == 2
+    assert sorted(meta["title"] for _, meta in store.search([0.0, 1.0], top_k=5)) == ["a v2", "b"]
+    store.remove([b, 12345])
+    store.persist()
+    reloaded = _store(tmp_path)
+    assert [meta["title"] for _, meta in reloaded.search([0.0, 1.0], top_k=5)] == ["a v2"]
+    reloaded.add_vectors([[1.0, 1.0]], [{"title": "c"}])
+    assert reloaded.index.ntotal == 2
+
+
+def test_delta_mode_writes_only_the_delta(tmp_path: Path) -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(0)
+    base = rng.standard_normal((50, 8)).astype(np.float32)
+    store = _store(tmp_path, delta=True)
+    store.add_vectors(base, [{"title": str(i)} for i in range(50)], ids=list(range(50)))
+    store.persist()  # the first persist builds the main index
+    index_file = tmp_path / "index.faiss"
+    delta_file = tmp_path / "index.faiss.delta"
+    main_bytes = index_file.read_bytes()
+    assert not delta_file.exists()
+
+    store = _store(tmp_path, mmap=True, delta=True)
+    store.add_vectors([base[1]], [{"title": "0 v2"}], ids=[0])  # replace
+    store.add_vectors([-base[2]], [{"title": "new"}], ids=[100])
+    store.remove([3])
+    hits = [meta["title"] for _, meta in store.search(base[1], top_k=3)]
+    assert hits[:2] == ["0 v2", "1"] or hits[:2] == ["1", "0 v2"]
+    assert [meta["title"] for _, meta in store.search(base[3], top_k=50)].count("3") == 0
+    store.persist()
+    assert index_file.read_bytes() == main_bytes
+    assert delta_file.exists()
+
+    # Reopening without delta mode merges the pending changes
+    store = _store(tmp_path)
+    assert store.index.ntotal == 50
+    assert store.search(-base[2], top_k=1)[0][1]["title"] == "new"
+    assert "3" not in [meta["title"] for _, meta in store.search(base[3], top_k=50)]
+    store.persist()
+    assert not delta_file.exists()
+    assert _store(tmp_path, delta=True).index.ntotal == 50
+
+
+def test_delta_mode_compacts_past_ratio(tmp_path: Path) -> None:
+    import numpy as np
+
+    vectors = np.eye(8, dtype=np.float32)
+    store = _store(tmp_path, delta=True, compact_ratio=0.25)
+    store.add_vectors(vectors[:4], [{"title": str(i)} for i in range(4)], ids=[0, 1, 2, 3])
+    store.persist()
+    store = _store(tmp_path, delta=True, compact_ratio=0.25)
+    store.add_vectors(vectors[4:6], [{"title": "4"}, {"title": "5"}], ids=[4, 5])
+    store.persist()  # 2 pending > 0.25 * 4
+    assert not (tmp_path / "index.faiss.delta").exists()
+    store = _store(tmp_path, delta=True)
+    assert store.index.ntotal == 6
+    assert store.search(vectors[5], top_k=1)[0][1]["title"] == "5"
+
+
+def test_delta_mode_with_pq_hides_replaced_and_removed(tmp_path: Path) -> None:
+    import numpy as np
+
+    rng = np.random.default_rng(2)
+    vectors = rng.standard_normal((300, 16)).astype(np.float32)
+    kwargs = dict(quantization="pq", pq_m=8, train_size=256, delta=True)
+    store = _store(tmp_path, **kwargs)
+    store.add_vectors(vectors, [{"title": str(i)} for i in range(300)], ids=list(range(300)))
+    store.persist()
+    store = _store(tmp_path, **kwargs)
+    store.remove([7])
+    store.add_vectors([vectors[9]], [{"title": "8 v2"}], ids=[8])
+    assert "7" not in [meta["title"] for _, meta in store.search(vectors[7], top_k=5)]
+    assert "8" not in [meta["title"] for _, meta in store.search(vectors[8], top_k=5)]
+    assert "8 v2" in [meta["title"] for _, meta in store.search(vectors[9], top_k=2)]